@@ -32,7 +32,7 @@ const projectDirs = [
 projectDirs.forEach(({ src, dest }) => {
   if (fs.existsSync(src)) {
     fs.readdirSync(src).forEach(file => {
-      if (file.match(/\.(jpg|jpeg|png|gif)$/i)) {
+      if (file.match(/\.(jpg|jpeg|png|gif|webp|svg|avif)$/i)) {
         fs.copyFileSync(
           path.join(src, file),
           path.join(dest, file)
@@ -0,0 +1,127 @@
+import time
+
+# Records the time of the last DOM mutation and returns
+# [ms since that mutation, resources loaded so far, document ready state].
+# The observer is installed on first call and survives until navigation.
+QUIESCENCE_SCRIPT = """
+if (!window.__scraperLastMutation) {
+    window.__scraperLastMutation = performance.now();
+    new MutationObserver(function () {
+        window.__scraperLastMutation = performance.now();
+    }).observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return [performance.now() - window.__scraperLastMutation,
+        performance.getEntriesByType('resource').length,
+        document.readyState];
+"""
+
+# Clicks every visible expander and returns how many were clicked
+CLICK_VISIBLE_SCRIPT = """
+var clicked = 0;
+document.querySelectorAll(arguments[0]).forEach(function (button) {
+    if (button.offsetParent !== null) {
+        button.click();
+        clicked++;
+    }
+});
+return clicked;
+"""
+
+
+class AdaptiveWaiter:
+    """Event-driven waits for a browser page under one latency budget
+
+    Instead of fixed sleeps every wait polls for its condition and returns
+    as soon as it holds: an element or URL change, or quiescence (no DOM
+    mutation and no new network resource for `quiet` seconds). All waits
+    of a scrape share `budget` seconds; a wait that would exceed it gives
+    up early, and the scrape continues with whatever has loaded. How long
+    each wait took and whether it was satisfied is kept in `telemetry`.
+    """
+
+    def __init__(self, driver, budget=30, quiet=0.5, poll=0.1):
+        self.driver = driver
+        self.budget = budget
+        self.quiet = quiet
+        self.poll = poll
+        self.spent = 0.0
+        self.telemetry = []
+
+    @classmethod
+    def from_config(cls, driver, config):
+        """Build a waiter from the 'linkedin' section of the scraper config"""
+        return cls(
+            driver,
+            budget=config.get('wait_budget', 30),
+            quiet=config.get('quiet_period', 0.5),
+            poll=config.get('poll_interval', 0.1)
+        )
+
+    @property
+    def remaining(self):
+        return max(0.0, self.budget - self.spent)
+
+    def _record(self, label, start, satisfied):
+        waited = time.perf_counter() - start
+        self.spent += waited
+        self.telemetry.append({'wait': label, 'seconds': round(waited, 3), 'satisfied': satisfied})
+        return satisfied
+
+    def until(self, label, condition, timeout=10):
+        """Poll condition(driver) until it is truthy; returns whether it was"""
+        start = time.perf_counter()
+        deadline = start + min(timeout, self.remaining)
+        while True:
+            try:
+                if condition(self.driver):
+                    return self._record(label, start, True)
+            except Exception:
+                pass
+            if time.perf_counter() >= deadline:
+                return self._record(label, start, False)
+            time.sleep(self.poll)
+
+    def quiescent(self, label, timeout=10):
+        """Wait until the page is loaded and neither its DOM nor its network activity changes"""
+        state = {'resources': None, 'since': None}
+
+        def settled(driver):
+            idle_ms, resources, ready_state = driver.execute_script(QUIESCENCE_SCRIPT)
+            now = time.perf_counter()
+            if resources != state['resources']:
+                state['resources'], state['since'] = resources, now
+            return (ready_state == 'complete'
+                    and idle_ms >= self.quiet * 1000
+                    and now - state['since'] >= self.quiet)
+
+        return self.until(label, settled, timeout)
+
+    def scroll_until_stable(self, label, expand_selector=None, max_rounds=20, timeout=5):
+        """Scroll to the bottom until the page height stops growing
+
+        After every scroll the waiter waits for quiescence; when
+        expand_selector is given, visible "show more" buttons matching it are
+        clicked in the same round. Returns the number of rounds scrolled.
+        """
+        last_height = None
+        rounds = 0
+        while rounds < max_rounds and self.remaining > 0:
+            height = self.driver.execute_script(
+                "window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight;"
+            )
+            clicked = 0
+            if expand_selector:
+                clicked = self.driver.execute_script(CLICK_VISIBLE_SCRIPT, expand_selector)
+            self.quiescent(f"{label} round {rounds + 1}", timeout)
+            rounds += 1
+            if height == last_height and not clicked:
+                break
+            last_height = height
+        return rounds
+
+    def summary(self):
+        """Print how long every wait took"""
+        print(f"\nWaits: {self.spent:.2f}s of {self.budget}s budget")
+        for entry in self.telemetry:
+            outcome = 'ok' if entry['satisfied'] else 'gave up'
+            print(f"  {entry['wait']}: {entry['seconds']:.2f}s ({outcome})")
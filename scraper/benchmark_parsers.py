@@ -0,0 +1,55 @@
+import contextlib
+import io
+import sys
+import time
+import linkedin_local_scraper as lls
+from html_parser import PARSER_BACKENDS, available_backends
+
+def extract_all(soup):
+    # Extractors print progress; keep the benchmark output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        index = lls.PageIndex(soup)
+        return {section: lls.extract_section(index, section) for section in lls.SECTION_SPECS}
+
+def run(markup, backend, partial, repeat):
+    best_parse, best_total = float('inf'), float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        soup = lls.parse_linkedin_page(markup, backend, partial)
+        parsed = time.perf_counter()
+        result = extract_all(soup)
+        best_parse = min(best_parse, parsed - start)
+        best_total = min(best_total, time.perf_counter() - start)
+    return result, best_parse, best_total
+
+def benchmark(path, repeat=3):
+    """Time every available backend on path and check output parity with html.parser"""
+    with open(path, 'r', encoding='utf-8') as f:
+        markup = f.read()
+    print(f"\n{path} ({len(markup) / 1024:.0f} KB)")
+
+    baseline, _, _ = run(markup, 'html.parser', False, 1)
+    all_match = True
+    installed = available_backends()
+    for backend in PARSER_BACKENDS:
+        if backend == 'auto':
+            continue
+        if backend not in installed:
+            print(f"  {backend:<12} not installed")
+            continue
+        for partial in (False, True):
+            if partial and backend == 'html5lib':
+                continue
+            result, parse_time, total_time = run(markup, backend, partial, repeat)
+            match = result == baseline
+            all_match = all_match and match
+            mode = 'partial' if partial else 'full'
+            print(f"  {backend:<12} {mode:<8} parse {parse_time * 1000:8.1f} ms  "
+                  f"parse+extract {total_time * 1000:8.1f} ms  parity {'OK' if match else 'MISMATCH'}")
+    return all_match
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or ['linkedin_debug.html']
+    ok = all([benchmark(path) for path in paths])
+    sys.exit(0 if ok else 1)
@@ -1,25 +1,64 @@
-import requests
-from bs4 import BeautifulSoup
-import youtube_dl
 import linkedin_api
-import PyPDF2
-import io
-from github import Github
 import os
 import json
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from pathlib import Path
-from pdf2image import convert_from_path
+from driver_pool import DriverPool
+from page_cache import PageCache
+from image_downloader import ImageDownloader
+from image_store import ImageStore
+from fetch_strategy import FetchStrategy
+from html_parser import make_soup
+from pdf_render import RenderSettings
+from pdf_images import save_pdf_images
+from pdf_ingest import PdfIngestEngine, PdfJob
+from pdf_cache import PdfCache
+from github_client import GitHubGraphQL, GitHubRest, TokenPool
+from youtube_channel import VideoEnricher, list_uploads
+from adaptive_wait import AdaptiveWaiter
+from linkedin_session import LinkedInSession
+from linkedin_profile import PROFILE_SECTIONS, extract_profile_sections
 import time
 
+APP_SCREENSHOTS_XPATH = "//h3[contains(text(), 'App Screenshots')]"
+LINKEDIN_SHOW_MORE = "button.show-more-less-button, button.inline-show-more-text__button"
+
+# CSS selectors that must be present in the raw HTML to skip the browser
+COMPANY_SELECTORS = ('meta[name="description"]', 'img')
+SIGNALHIRE_SELECTORS = ('div.company-info',)
+
 class ContentScraper:
     def __init__(self, config_path):
         self.config = self._load_config(config_path)
+        self.html_parser = self.config.get('html_parser', 'auto')
+        pdf_config = self.config.get('pdf', {})
+        self.render_settings = RenderSettings.from_config(pdf_config)
+        self.pdf_engine = PdfIngestEngine.from_config(
+            self.render_settings, pdf_config, PdfCache.from_config(self.config.get('pdf_cache', {}))
+        )
         self.setup_selenium()
+        self.page_cache = PageCache.from_config(self.config.get('page_cache', {}))
+        self.downloader = ImageDownloader.from_config(self.config.get('downloads', {}))
+        self.image_store = ImageStore.from_config(self.downloader, self.config.get('image_store', {}))
+        github_config = self.config.get('github', {})
+        self.github_rest = GitHubRest.from_config(self.downloader.session, github_config)
+        # GraphQL has its own quota, so it gets a separate pool over the same tokens
+        self.github_graphql = GitHubGraphQL(
+            self.downloader.session, TokenPool.from_config(github_config), github_config.get('timeout', 10)
+        )
+        self.video_enricher = VideoEnricher.from_config(self.config.get('youtube', {}))
+        self.linkedin_session = LinkedInSession.from_config(self.config.get('linkedin', {}))
+        fetch_config = self.config.get('fetch', {})
+        self.fetch_strategy = FetchStrategy(
+            self.downloader.session,
+            self._render_page,
+            self._parse_html,
+            timeout=fetch_config.get('timeout', 10),
+            static_first=fetch_config.get('static_first', True),
+            state_path=fetch_config.get('state_path')
+        )
         
     def _load_config(self, config_path):
         # Load configuration from JSON file
@@ -27,27 +66,67 @@ class ContentScraper:
             return json.load(f)
     
     def setup_selenium(self):
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        self.driver = webdriver.Chrome(options=chrome_options)
+        # Chrome is only started when a method first leases a driver
+        self.driver_pool = DriverPool.from_config(self.config.get('selenium', {}))
+
+    def close(self):
+        """Release browser and network resources"""
+        self.driver_pool.close()
+        if self.github_rest.cache is not None:
+            self.github_rest.cache.save()
+        self.downloader.close()
+        self.pdf_engine.close()
+
+    def _render_page(self, url, scroll_to_xpath=None):
+        """Load a page in a pooled driver and return (title, page_source)"""
+        with self.driver_pool.lease() as driver:
+            driver.get(url)
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+            if scroll_to_xpath:
+                # Scroll the section into view so lazy-loaded images get their src
+                elements = driver.find_elements(By.XPATH, scroll_to_xpath)
+                if elements:
+                    driver.execute_script("arguments[0].scrollIntoView(true);", elements[0])
+                    time.sleep(2)  # Wait for images to load
+            return driver.title, driver.page_source
+
+    def _parse_html(self, page_source):
+        return make_soup(page_source, self.html_parser)
+
+    def _get_page(self, url, scroll_to_xpath=None, expect=()):
+        """Return the page for url, loading it at most once per run
+
+        When expect lists CSS selectors the raw HTML is tried first and the
+        browser is only used if they are missing.
+        """
+        return self.page_cache.get_page(
+            url, lambda: self.fetch_strategy.fetch(url, expect, scroll_to_xpath)
+        )
+
+    def _get_soup(self, url, scroll_to_xpath=None, expect=()):
+        """Return the parsed page for url, parsing it at most once per run"""
+        return self.page_cache.get_soup(
+            url,
+            lambda: self.fetch_strategy.fetch(url, expect, scroll_to_xpath),
+            self._parse_html
+        )
     
     def scrape_company_website(self, url):
         """Scrape content from company website"""
         try:
-            self.driver.get(url)
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            page = self._get_page(url, expect=COMPANY_SELECTORS)
             
             data = {
-                'title': self.driver.title,
+                'title': page.title,
                 'description': '',
                 'products': [],
                 'images': []
             }
             
             # Get main content
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = self._get_soup(url, expect=COMPANY_SELECTORS)
             
             # Extract relevant information (customize based on website structure)
             data['description'] = soup.find('meta', {'name': 'description'})['content']
@@ -70,57 +149,56 @@ class ContentScraper:
             print(f"Error scraping company website: {e}")
             return None
 
-    def scrape_youtube_channel(self, channel_url):
-        """Scrape YouTube channel information and videos"""
+    def scrape_youtube_channel(self, channel_url, previous=None, backfill=False):
+        """Scrape YouTube channel information and videos
+
+        The uploads are listed in one flat pass, then completed with the
+        full metadata of every video that is not in the video cache.
+
+        With previous (the last youtube.json) only uploads newer than the
+        videos it already holds are listed and they are merged in front of
+        them; saved videos whose cache entry expired are refreshed.
+        backfill lists the whole channel; otherwise a fresh scrape takes the
+        newest youtube.max_videos uploads.
+        """
         try:
-            ydl_opts = {
-                'extract_flat': True,
-                'force_generic_extractor': True,
-                'playlistend': 50  # Increase this number to get more videos
-            }
+            if backfill:
+                previous = None
+                limit = None
+            else:
+                limit = None if previous else self.config.get('youtube', {}).get('max_videos', 50)
+            known = previous['videos'] if previous else []
+
+            channel, entries = list_uploads(channel_url, limit, {video['url'] for video in known})
+            if previous:
+                print(f"Found {len(entries)} new YouTube video(s)")
+            # Saved records work as entries too: fresh ones are cache hits,
+            # stale ones are extracted again like any other video
+            videos, newest = self.video_enricher.enrich(entries + known)
             
-            with youtube_dl.YoutubeDL(ydl_opts) as ydl:
-                # Get channel uploads playlist
-                channel_data = ydl.extract_info(channel_url, download=False)
-                uploads_playlist_url = f"https://www.youtube.com/channel/{channel_data['id']}/videos"
-                playlist_data = ydl.extract_info(uploads_playlist_url, download=False)
-                
-                videos = []
-                for entry in playlist_data.get('entries', []):
-                    if entry:
-                        videos.append({
-                            'title': entry.get('title', ''),
-                            'url': entry.get('url', ''),
-                            'thumbnail': entry.get('thumbnail', ''),
-                            'description': entry.get('description', ''),
-                            'view_count': entry.get('view_count', 0),
-                            'upload_date': entry.get('upload_date', '')
-                        })
-                
-                return {
-                    'channel_name': channel_data.get('uploader', ''),
-                    'description': channel_data.get('description', ''),
-                    'subscriber_count': channel_data.get('subscriber_count', ''),
-                    'videos': videos
-                }
+            return {
+                'channel_name': channel['name'] or (previous or {}).get('channel_name', ''),
+                'description': channel['description'] or (previous or {}).get('description', ''),
+                'subscriber_count': channel['subscriber_count']
+                                    or (newest or {}).get('channel_follower_count')
+                                    or (previous or {}).get('subscriber_count', ''),
+                'last_video_id': videos[0]['url'] if videos else None,
+                'last_upload_date': videos[0]['upload_date'] if videos else None,
+                'videos': videos
+            }
         except Exception as e:
             print(f"Error scraping YouTube channel: {e}")
             return None
 
     def scrape_linkedin_profile(self, profile_url):
-        """Scrape LinkedIn profile information using Selenium"""
+        """Scrape LinkedIn profile information using Selenium
+
+        Waits are event-driven and share the linkedin.wait_budget; their
+        durations are printed at the end. The login session is kept in a
+        persistent browser profile and the form is only used when it expired.
+        """
         try:
-            # Configure Selenium
-            chrome_options = Options()
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('--disable-notifications')
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            linkedin_driver = webdriver.Chrome(options=chrome_options)
-            linkedin_driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
-            })
+            linkedin_driver = self.linkedin_session.start_driver()
             
             # Initialize data dictionary
             data = {
@@ -135,110 +213,28 @@ class ContentScraper:
                 'profile_image_path': None
             }
             
+            waiter = AdaptiveWaiter.from_config(linkedin_driver, self.config.get('linkedin', {}))
             try:
-                # Login process
-                linkedin_driver.get("https://www.linkedin.com/login")
-                time.sleep(3)
-                
-                username_elem = WebDriverWait(linkedin_driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "username"))
-                )
-                password_elem = WebDriverWait(linkedin_driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "password"))
-                )
-                
-                username_elem.send_keys(self.config['linkedin']['username'])
-                password_elem.send_keys(self.config['linkedin']['password'])
-                
-                signin_button = WebDriverWait(linkedin_driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
-                )
-                signin_button.click()
-                time.sleep(5)
+                self.linkedin_session.ensure_logged_in(linkedin_driver, waiter)
                 
-                # Navigate to profile and wait longer
+                # Navigate to profile and wait until it stops changing
                 linkedin_driver.get(profile_url)
-                time.sleep(10)  # Increased wait time
+                waiter.quiescent('profile load')
                 
-                # Scroll more thoroughly with pauses
-                total_height = linkedin_driver.execute_script("return document.body.scrollHeight")
-                for i in range(10):  # Increased scroll iterations
-                    height = total_height * (i/10)
-                    linkedin_driver.execute_script(f"window.scrollTo(0, {height});")
-                    time.sleep(1)
-                    
-                    # Try to click any "Show more" buttons
-                    try:
-                        show_more_buttons = linkedin_driver.find_elements(By.CSS_SELECTOR, 
-                            "button.show-more-less-button, button.inline-show-more-text__button")
-                        for button in show_more_buttons:
-                            if button.is_displayed():
-                                linkedin_driver.execute_script("arguments[0].click();", button)
-                                time.sleep(1)
-                    except:
-                        pass
-
-                # Certifications section - updated selectors and wait time
-                print("\nLooking for certifications...")
+                # Scroll until lazy sections stop loading, expanding "Show more" as they appear
                 try:
-                    # Wait for certifications section
-                    WebDriverWait(linkedin_driver, 10).until(
-                        EC.presence_of_element_located((By.XPATH, "//section[contains(.//span/text(), 'Certifications') or contains(.//span/text(), 'Licenses')]"))
-                    )
-                    
-                    cert_items = linkedin_driver.find_elements(By.XPATH, 
-                        "//section[contains(.//span/text(), 'Certifications') or contains(.//span/text(), 'Licenses')]//div[contains(@class, 'pvs-list')]//li")
-                    
-                    print(f"Found {len(cert_items)} certification items")
-                    
-                    for item in cert_items:
-                        try:
-                            # Get all text elements within the certification item
-                            cert_elements = item.find_elements(By.CSS_SELECTOR, "span.visually-hidden")
-                            cert_text = [elem.text.strip() for elem in cert_elements if elem.text.strip()]
-                            
-                            if cert_text:
-                                print(f"Processing certification: {cert_text[0]}")
-                                data['certifications'].append({
-                                    'name': cert_text[0],
-                                    'issuer': cert_text[1] if len(cert_text) > 1 else '',
-                                    'date': cert_text[2] if len(cert_text) > 2 else ''
-                                })
-                        except Exception as e:
-                            print(f"Error processing certification item: {e}")
+                    waiter.scroll_until_stable('scroll', LINKEDIN_SHOW_MORE)
                 except Exception as e:
-                    print(f"Error getting certifications: {e}")
+                    print(f"Error scrolling profile: {e}")
 
-                # Projects section - updated selectors and wait time
-                print("\nLooking for projects...")
+                # All sections are read in one script execution once any of them is present
+                print("\nLooking for certifications and projects...")
                 try:
-                    # Wait for projects section
-                    WebDriverWait(linkedin_driver, 10).until(
-                        EC.presence_of_element_located((By.XPATH, "//section[contains(.//span/text(), 'Projects')]"))
-                    )
-                    
-                    project_items = linkedin_driver.find_elements(By.XPATH, 
-                        "//section[contains(.//span/text(), 'Projects')]//div[contains(@class, 'pvs-list')]//li")
-                    
-                    print(f"Found {len(project_items)} project items")
-                    
-                    for item in project_items:
-                        try:
-                            # Get all text elements within the project item
-                            project_elements = item.find_elements(By.CSS_SELECTOR, "span.visually-hidden")
-                            project_text = [elem.text.strip() for elem in project_elements if elem.text.strip()]
-                            
-                            if project_text:
-                                print(f"Processing project: {project_text[0]}")
-                                data['projects'].append({
-                                    'name': project_text[0],
-                                    'description': project_text[1] if len(project_text) > 1 else '',
-                                    'date': project_text[2] if len(project_text) > 2 else ''
-                                })
-                        except Exception as e:
-                            print(f"Error processing project item: {e}")
+                    waiter.until('profile sections', lambda d: d.find_elements(
+                        By.XPATH, ' | '.join(spec['xpath'] for spec in PROFILE_SECTIONS.values())))
+                    data.update(extract_profile_sections(linkedin_driver))
                 except Exception as e:
-                    print(f"Error getting projects: {e}")
+                    print(f"Error getting profile sections: {e}")
 
                 # Print detailed debug info
                 print("\nDetailed section information:")
@@ -250,6 +246,7 @@ class ContentScraper:
                 if data['projects']:
                     print("First project:", data['projects'][0])
                 
+                waiter.summary()
                 return data
                 
             finally:
@@ -260,29 +257,39 @@ class ContentScraper:
             print(f"Error details: {str(e)}")
             return None
 
-    def scrape_github_profile(self, github_username):
-        """Scrape GitHub profile and repositories"""
+    def github_fingerprint(self, github_username):
+        """Cheap change marker for a GitHub profile (profile update and latest push time)
+
+        Both calls are conditional, so an unchanged profile costs no quota.
+        """
         try:
-            g = Github(self.config['github']['access_token'])
-            user = g.get_user(github_username)
-            
-            repos = []
-            for repo in user.get_repos():
-                repos.append({
-                    'name': repo.name,
-                    'description': repo.description,
-                    'stars': repo.stargazers_count,
-                    'forks': repo.forks_count,
-                    'url': repo.html_url,
-                    'languages': repo.get_languages()
-                })
-            
+            user, _ = self.github_rest.get(f"https://api.github.com/users/{github_username}")
+            latest, _ = self.github_rest.get(
+                f"https://api.github.com/users/{github_username}/repos",
+                {'sort': 'pushed', 'per_page': 1}
+            )
             return {
-                'name': user.name,
-                'bio': user.bio,
-                'location': user.location,
-                'repositories': repos
+                'updated_at': user.get('updated_at'),
+                'public_repos': user.get('public_repos'),
+                'pushed_at': latest[0].get('pushed_at') if latest else None
             }
+        except Exception as e:
+            print(f"Error fingerprinting GitHub profile: {e}")
+            return None
+
+    def scrape_github_profile(self, github_username):
+        """Scrape GitHub profile and repositories
+
+        With github.api set to 'graphql' and a token available, the profile
+        is fetched in a few paginated GraphQL queries; otherwise through the
+        REST API, where unchanged resources are answered from the ETag cache.
+        """
+        github_config = self.config.get('github', {})
+        try:
+            if github_config.get('api', 'rest') == 'graphql' and self.github_rest.tokens.authenticated:
+                return self.github_graphql.fetch_profile(github_username)
+
+            return self.github_rest.fetch_profile(github_username)
         except Exception as e:
             print(f"Error scraping GitHub profile: {e}")
             return None
@@ -290,59 +297,58 @@ class ContentScraper:
     def extract_images_from_pdf(self, pdf_path, output_folder):
         """Extract images from PDF and save them"""
         try:
-            # Create output folder
-            os.makedirs(output_folder, exist_ok=True)
-            
-            # Convert PDF pages to images
-            pages = convert_from_path(pdf_path)
-            
-            saved_images = []
-            for i, page in enumerate(pages):
-                image_path = os.path.join(output_folder, f'page_{i + 1}.jpg')
-                page.save(image_path, 'JPEG')
-                saved_images.append(image_path)
-            
-            return saved_images
+            return save_pdf_images(
+                pdf_path, output_folder, self.render_settings,
+                self.pdf_engine.image_mode, self.pdf_engine.min_image_size
+            )
         except Exception as e:
             print(f"Error extracting images from PDF: {e}")
             return None
 
-    def scrape_cv_pdf(self, pdf_url):
-        """Scrape CV from PDF"""
+    def scrape_cv_pdf(self, pdf_url, previous=None):
+        """Scrape CV from PDF
+
+        The PDF is streamed once into a spool file that both text and image
+        extraction read. When previous holds the last result, its validators
+        make the request conditional and a 304 reply returns it unchanged.
+        """
         try:
-            response = requests.get(pdf_url)
-            pdf_file = io.BytesIO(response.content)
-            
-            # Save PDF temporarily
-            temp_pdf_path = 'scraped_data/temp_cv.pdf'
-            os.makedirs('scraped_data', exist_ok=True)
-            with open(temp_pdf_path, 'wb') as f:
-                f.write(response.content)
-            
-            # Extract text
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            cv_text = ""
-            for page in pdf_reader.pages:
-                cv_text += page.extract_text()
-            
-            # Extract images
-            images_folder = 'scraped_data/images/cv'
-            saved_images = self.extract_images_from_pdf(temp_pdf_path, images_folder)
-            
-            # Clean up temporary PDF
-            os.remove(temp_pdf_path)
+            headers = {}
+            if previous and all(os.path.exists(path) for path in previous.get('saved_images') or []):
+                if previous.get('etag'):
+                    headers['If-None-Match'] = previous['etag']
+                if previous.get('last_modified'):
+                    headers['If-Modified-Since'] = previous['last_modified']
+
+            download = self.downloader.download(pdf_url, 'scraped_data/.cache/cv/cv.pdf', headers)
+            if download.not_modified and headers:
+                print("CV not modified since last run")
+                return previous
+            if not download.ok:
+                raise Exception(download.error)
+
+            result = self.pdf_engine.ingest([PdfJob(download.path, 'scraped_data/images/cv')])[0]
+            if result.error:
+                raise result.error
             
             return {
-                'raw_text': cv_text,
+                'raw_text': result.text,
                 'url': pdf_url,
-                'saved_images': saved_images
+                'saved_images': result.saved_images,
+                'etag': download.etag,
+                'last_modified': download.last_modified
             }
         except Exception as e:
             print(f"Error scraping CV: {e}")
             return None
 
-    def scrape_local_pdfs(self, docs_folder):
-        """Scrape PDFs from local docs folder"""
+    def scrape_local_pdfs(self, docs_folder, reuse=None):
+        """Scrape PDFs from local docs folder
+
+        reuse maps a PDF path to a previously extracted record that is still
+        valid; those files are not parsed again.
+        """
+        reuse = reuse or {}
         try:
             pdf_data = []
             docs_path = Path(docs_folder)
@@ -353,24 +359,29 @@ class ContentScraper:
             # Get all PDF files
             pdf_files = list(docs_path.glob('**/*.pdf'))
             
+            # Text and images of every file not reused are extracted in parallel
+            jobs = [
+                PdfJob(pdf_file, f'scraped_data/images/docs/{pdf_file.stem}')
+                for pdf_file in pdf_files if str(pdf_file) not in reuse
+            ]
+            results = {result.job.pdf_path: result for result in self.pdf_engine.iter_ingest(jobs)}
+            
             for pdf_file in pdf_files:
-                with open(pdf_file, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    pdf_text = ""
-                    
-                    for page in pdf_reader.pages:
-                        pdf_text += page.extract_text()
-                    
-                    # Extract images
-                    images_folder = f'scraped_data/images/docs/{pdf_file.stem}'
-                    saved_images = self.extract_images_from_pdf(str(pdf_file), images_folder)
-                    
-                    pdf_data.append({
-                        'filename': pdf_file.name,
-                        'path': str(pdf_file),
-                        'raw_text': pdf_text,
-                        'saved_images': saved_images
-                    })
+                if str(pdf_file) in reuse:
+                    pdf_data.append(reuse[str(pdf_file)])
+                    continue
+                
+                result = results[str(pdf_file)]
+                if result.error:
+                    print(f"Error scraping {pdf_file.name}: {result.error}")
+                    continue
+                
+                pdf_data.append({
+                    'filename': pdf_file.name,
+                    'path': str(pdf_file),
+                    'raw_text': result.text,
+                    'saved_images': result.saved_images
+                })
             
             return pdf_data
         except Exception as e:
@@ -380,12 +391,7 @@ class ContentScraper:
     def scrape_signalhire_company(self, url):
         """Scrape company information from SignalHire"""
         try:
-            self.driver.get(url)
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = self._get_soup(url, expect=SIGNALHIRE_SELECTORS)
             
             data = {
                 'company_name': '',
@@ -411,12 +417,8 @@ class ContentScraper:
     def scrape_app_info(self, url):
         """Scrape app information from AppAdvice"""
         try:
-            self.driver.get(url)
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Rendered with the screenshots in view so scrape_app_screenshots can reuse it
+            soup = self._get_soup(url, scroll_to_xpath=APP_SCREENSHOTS_XPATH)
             
             data = {
                 'app_name': '',
@@ -449,24 +451,23 @@ class ContentScraper:
             # Save screenshots
             screenshots_section = soup.find('div', string=lambda text: text and "App Screenshots" in text)
             if screenshots_section:
-                os.makedirs('scraped_data/images/app', exist_ok=True)
+                img_urls = []
                 screenshots = screenshots_section.find_next('div').find_all('img')
-                for i, img in enumerate(screenshots):
+                for img in screenshots:
                     img_url = img.get('src')
                     if img_url:
                         if not img_url.startswith('http'):
                             img_url = f"https:{img_url}" if img_url.startswith('//') else f"https://appadvice.com{img_url}"
-                        try:
-                            response = requests.get(img_url)
-                            img_path = f'scraped_data/images/app/screenshot_{i}.jpg'
-                            with open(img_path, 'wb') as f:
-                                f.write(response.content)
-                            data['screenshots'].append({
-                                'path': img_path,
-                                'original_url': img_url
-                            })
-                        except Exception as e:
-                            print(f"Error saving screenshot {img_url}: {e}")
+                        img_urls.append(img_url)
+                
+                for result in self.image_store.fetch_many(img_urls, tag='app'):
+                    if result.ok:
+                        data['screenshots'].append({
+                            'path': result.path,
+                            'original_url': result.url
+                        })
+                    else:
+                        print(f"Error saving screenshot {result.url}: {result.error}")
             
             return data
         except Exception as e:
@@ -476,40 +477,29 @@ class ContentScraper:
     def scrape_app_screenshots(self, url):
         """Specifically scrape screenshots from AppAdvice"""
         try:
-            self.driver.get(url)
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
             # Scroll to screenshots section
-            screenshots_heading = self.driver.find_element(By.XPATH, "//h3[contains(text(), 'App Screenshots')]")
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", screenshots_heading)
-            time.sleep(2)  # Wait for images to load
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = self._get_soup(url, scroll_to_xpath=APP_SCREENSHOTS_XPATH)
             
             # Find all screenshot images
             screenshots = []
             screenshot_divs = soup.find_all('img', {'alt': lambda x: x and 'screenshot' in x.lower()})
             
-            os.makedirs('scraped_data/images/app', exist_ok=True)
-            
-            for i, img in enumerate(screenshot_divs):
+            img_urls = []
+            for img in screenshot_divs:
                 img_url = img.get('src')
                 if img_url:
                     if not img_url.startswith('http'):
                         img_url = f"https:{img_url}" if img_url.startswith('//') else f"https://appadvice.com{img_url}"
-                    try:
-                        response = requests.get(img_url, headers={'User-Agent': 'Mozilla/5.0'})
-                        img_path = f'scraped_data/images/app/screenshot_{i}.jpg'
-                        with open(img_path, 'wb') as f:
-                            f.write(response.content)
-                        screenshots.append({
-                            'path': img_path,
-                            'original_url': img_url
-                        })
-                    except Exception as e:
-                        print(f"Error saving screenshot {img_url}: {e}")
+                    img_urls.append(img_url)
+            
+            for result in self.image_store.fetch_many(img_urls, tag='app'):
+                if result.ok:
+                    screenshots.append({
+                        'path': result.path,
+                        'original_url': result.url
+                    })
+                else:
+                    print(f"Error saving screenshot {result.url}: {result.error}")
             
             return screenshots
         except Exception as e:
@@ -517,37 +507,32 @@ class ContentScraper:
             return None
 
     def save_images(self, url, folder_name):
-        """Save images from a website to a folder"""
+        """Save images from a website to the image store, tagged with folder_name"""
         try:
-            self.driver.get(url)
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = self._get_soup(url, expect=('img',))
             images = soup.find_all('img')
             
             saved_images = []
-            os.makedirs(f'scraped_data/images/{folder_name}', exist_ok=True)
+            img_urls = []
+            alt_texts = []
             
-            for i, img in enumerate(images):
+            for img in images:
                 img_url = img.get('src')
                 if img_url:
                     if not img_url.startswith('http'):
                         img_url = f"https:{img_url}" if img_url.startswith('//') else f"{url}/{img_url}"
-                    
-                    try:
-                        response = requests.get(img_url)
-                        img_path = f'scraped_data/images/{folder_name}/image_{i}.jpg'
-                        with open(img_path, 'wb') as f:
-                            f.write(response.content)
-                        saved_images.append({
-                            'original_url': img_url,
-                            'local_path': img_path,
-                            'alt_text': img.get('alt', '')
-                        })
-                    except Exception as e:
-                        print(f"Error saving image {img_url}: {e}")
+                    img_urls.append(img_url)
+                    alt_texts.append(img.get('alt', ''))
+            
+            for result, alt_text in zip(self.image_store.fetch_many(img_urls, tag=folder_name), alt_texts):
+                if result.ok:
+                    saved_images.append({
+                        'original_url': result.url,
+                        'local_path': result.path,
+                        'alt_text': alt_text
+                    })
+                else:
+                    print(f"Error saving image {result.url}: {result.error}")
             
             return saved_images
         except Exception as e:
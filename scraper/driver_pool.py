@@ -0,0 +1,169 @@
+import os
+import threading
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+
+class _PooledDriver:
+    """A WebDriver instance together with its pool bookkeeping"""
+
+    def __init__(self, driver, slot):
+        self.driver = driver
+        self.slot = slot
+        self.pages = 0
+
+
+class DriverPool:
+    """Pool of headless Chrome drivers shared by the scraping methods
+
+    Drivers are started lazily on first lease, reused across pages and
+    recycled after `max_pages` leases or once the JS heap of the loaded page
+    grows past `max_heap_mb`, which keeps long batch runs from leaking memory.
+    When `profile_dir` / `disk_cache_dir` are set each slot gets its own
+    persistent Chrome profile / HTTP cache directory so assets survive
+    between runs. Page loads and scripts give up after `page_load_timeout`
+    seconds so a hung page cannot block a stage forever.
+    """
+
+    def __init__(self, size=1, max_pages=50, max_heap_mb=None, profile_dir=None,
+                 disk_cache_dir=None, headless=True, extra_arguments=(), page_load_timeout=30):
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.max_heap_mb = max_heap_mb
+        self.profile_dir = profile_dir
+        self.disk_cache_dir = disk_cache_dir
+        self.headless = headless
+        self.extra_arguments = list(extra_arguments)
+        self.page_load_timeout = page_load_timeout
+
+        self._idle = []
+        self._slots_in_use = set()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a pool from the 'selenium' section of the scraper config"""
+        return cls(
+            size=config.get('pool_size', 1),
+            max_pages=config.get('max_pages_per_driver', 50),
+            max_heap_mb=config.get('max_heap_mb'),
+            profile_dir=config.get('profile_dir'),
+            disk_cache_dir=config.get('disk_cache_dir'),
+            headless=config.get('headless', True),
+            page_load_timeout=config.get('page_load_timeout', 30)
+        )
+
+    def _build_options(self, slot):
+        chrome_options = Options()
+        if self.headless:
+            chrome_options.add_argument("--headless")
+        if self.profile_dir:
+            # Chrome locks a profile directory, so every slot needs its own
+            path = os.path.abspath(os.path.join(self.profile_dir, f'driver_{slot}'))
+            os.makedirs(path, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={path}")
+        if self.disk_cache_dir:
+            path = os.path.abspath(os.path.join(self.disk_cache_dir, f'driver_{slot}'))
+            os.makedirs(path, exist_ok=True)
+            chrome_options.add_argument(f"--disk-cache-dir={path}")
+        for argument in self.extra_arguments:
+            chrome_options.add_argument(argument)
+        return chrome_options
+
+    def _start_driver(self, slot):
+        print(f"Starting Chrome driver (slot {slot})...")
+        driver = webdriver.Chrome(options=self._build_options(slot))
+        if self.page_load_timeout:
+            driver.set_page_load_timeout(self.page_load_timeout)
+            driver.set_script_timeout(self.page_load_timeout)
+        return _PooledDriver(driver, slot)
+
+    def _acquire(self):
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._slots_in_use) < self.size:
+                    slot = min(set(range(self.size)) - self._slots_in_use)
+                    self._slots_in_use.add(slot)
+                    break
+                self._condition.wait()
+
+        # Start Chrome outside the lock so other leases are not blocked on it
+        try:
+            return self._start_driver(slot)
+        except Exception:
+            with self._condition:
+                self._slots_in_use.discard(slot)
+                self._condition.notify()
+            raise
+
+    def _heap_exceeded(self, entry):
+        if not self.max_heap_mb:
+            return False
+        try:
+            used = entry.driver.execute_script(
+                "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : 0"
+            )
+            return (used or 0) > self.max_heap_mb * 1024 * 1024
+        except WebDriverException:
+            return True
+
+    def _retire(self, entry, reason):
+        print(f"Recycling Chrome driver (slot {entry.slot}) after {entry.pages} pages: {reason}")
+        try:
+            entry.driver.quit()
+        except Exception as e:
+            print(f"Error closing driver: {e}")
+
+    def _release(self, entry, broken):
+        entry.pages += 1
+        reason = None
+        if broken:
+            reason = 'driver error'
+        elif self.max_pages and entry.pages >= self.max_pages:
+            reason = 'page limit reached'
+        elif self._heap_exceeded(entry):
+            reason = 'memory limit reached'
+
+        if reason or self._closed:
+            self._retire(entry, reason or 'pool closed')
+            with self._condition:
+                self._slots_in_use.discard(entry.slot)
+                self._condition.notify()
+        else:
+            with self._condition:
+                self._idle.append(entry)
+                self._condition.notify()
+
+    @contextmanager
+    def lease(self):
+        """Borrow a driver for the duration of a `with` block"""
+        entry = self._acquire()
+        broken = False
+        try:
+            yield entry.driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self._release(entry, broken)
+
+    def close(self):
+        """Quit every idle driver; leased drivers are quit when returned"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for entry in idle:
+                self._slots_in_use.discard(entry.slot)
+            self._condition.notify_all()
+        for entry in idle:
+            try:
+                entry.driver.quit()
+            except Exception as e:
+                print(f"Error closing driver: {e}")
@@ -0,0 +1,93 @@
+import json
+import os
+import threading
+from urllib.parse import urlparse
+
+
+class FetchStrategy:
+    """Choose between a plain HTTP fetch and a browser render per domain
+
+    A page is first fetched over the pooled HTTP session and parsed. If every
+    expected CSS selector is present the raw HTML is used as is; otherwise the
+    page is rendered in the browser. The outcome is remembered per domain so
+    later pages skip the attempt that is known not to work. Decisions can be
+    persisted to `state_path` between runs.
+    """
+
+    STATIC = 'static'
+    BROWSER = 'browser'
+
+    def __init__(self, session, render, parse, timeout=10, static_first=True, state_path=None):
+        self.session = session
+        self.render = render
+        self.parse = parse
+        self.timeout = timeout
+        self.static_first = static_first
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self.domains = self._load_state()
+
+    def _load_state(self):
+        if not self.state_path:
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error loading fetch strategy state: {e}")
+            return {}
+
+    def _remember(self, domain, choice):
+        with self._lock:
+            if self.domains.get(domain) == choice:
+                return
+            self.domains[domain] = choice
+            snapshot = dict(self.domains)
+        if self.state_path:
+            try:
+                os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+                tmp_path = f"{self.state_path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2, sort_keys=True)
+                os.replace(tmp_path, self.state_path)
+            except Exception as e:
+                print(f"Error saving fetch strategy state: {e}")
+
+    def _fetch_static(self, url, expect):
+        """Return (title, page_source, soup) if the raw HTML has every expected selector
+
+        Network errors propagate so that a transient failure is not mistaken
+        for a page that needs JavaScript.
+        """
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        if 'html' not in response.headers.get('Content-Type', 'text/html'):
+            return None
+        soup = self.parse(response.text)
+        if not all(soup.select_one(selector) is not None for selector in expect):
+            return None
+        title = soup.title.get_text(strip=True) if soup.title else ''
+        return title, response.text, soup
+
+    def fetch(self, url, expect=(), scroll_to_xpath=None):
+        """Return (title, page_source[, soup]) using the cheapest strategy that works
+
+        Pages that need scrolling or have no expected selectors to verify
+        against always use the browser.
+        """
+        domain = urlparse(url).netloc
+        if self.static_first and expect and not scroll_to_xpath:
+            if self.domains.get(domain) != self.BROWSER:
+                try:
+                    page = self._fetch_static(url, expect)
+                    if page is not None:
+                        print(f"Fetched {url} without a browser")
+                        self._remember(domain, self.STATIC)
+                        return page
+                    print(f"Expected content missing from raw HTML, falling back to browser for {url}")
+                    self._remember(domain, self.BROWSER)
+                except Exception as e:
+                    print(f"Static fetch failed for {url}, falling back to browser: {e}")
+        return self.render(url, scroll_to_xpath)
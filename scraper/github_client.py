@@ -0,0 +1,355 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+GITHUB_GRAPHQL_URL = 'https://api.github.com/graphql'
+
+# One page of a user's public repositories with everything github.json needs.
+# Ordered by name like the REST listing, languages by size like /languages.
+PROFILE_QUERY = """
+query($login: String!, $cursor: String) {
+  user(login: $login) {
+    name
+    bio
+    location
+    repositories(first: 100, after: $cursor, privacy: PUBLIC, ownerAffiliations: OWNER,
+                 orderBy: {field: NAME, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        description
+        stargazerCount
+        forkCount
+        url
+        languages(first: 100, orderBy: {field: SIZE, direction: DESC}) {
+          edges { size node { name } }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def resolve_token(value):
+    """Expand a token given as "$ENV_VAR"; None when unset or unresolved"""
+    if not value:
+        return None
+    token = os.path.expandvars(value)
+    return None if token.startswith('$') else token
+
+
+class RateLimit:
+    """Last known quota of one token, from its X-RateLimit headers"""
+
+    def __init__(self):
+        self.remaining = None
+        self.reset_at = None
+        self.paused_until = 0
+
+    def ready_at(self, reserve):
+        """Time from which this token may be used again (0 when usable now)"""
+        if self.paused_until > time.time():
+            return self.paused_until
+        if self.remaining is None or self.remaining > reserve:
+            return 0
+        return self.reset_at + 1
+
+
+class TokenPool:
+    """Tokens and their rate-limit budgets, tracked in one place
+
+    acquire() hands out the usable token with the most remaining quota and
+    takes one unit from its budget, so concurrent callers cannot overshoot
+    it between responses. A token whose quota is down to `reserve`, or that
+    was told to back off after a secondary rate limit, is skipped until it
+    recovers. When no token is usable the caller waits for the earliest
+    one, or gives up if that is more than `max_wait` seconds away. Without
+    any token the pool holds a single None (unauthenticated) entry.
+    """
+
+    def __init__(self, tokens, reserve=10, max_wait=900):
+        self.limits = {token: RateLimit() for token in (tokens or [None])}
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a pool from the 'github' section of the scraper config
+
+        access_tokens lists several tokens; access_token is used otherwise.
+        Entries may be "$ENV_VAR" references.
+        """
+        values = config.get('access_tokens') or [config.get('access_token')]
+        tokens = list(dict.fromkeys(token for token in map(resolve_token, values) if token))
+        return cls(tokens, config.get('rate_limit_reserve', 10), config.get('max_rate_limit_wait', 900))
+
+    @property
+    def authenticated(self):
+        return None not in self.limits
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.time()
+                ready = [
+                    (token, limit) for token, limit in self.limits.items()
+                    if limit.ready_at(self.reserve) <= now
+                ]
+                if ready:
+                    token, limit = max(
+                        ready, key=lambda item: float('inf') if item[1].remaining is None else item[1].remaining
+                    )
+                    if limit.remaining is not None:
+                        limit.remaining -= 1
+                    return token
+                delay = min(limit.ready_at(self.reserve) for limit in self.limits.values()) - now
+            if delay > self.max_wait:
+                raise Exception(f"GitHub rate limit exhausted on all tokens, next reset in {delay:.0f}s")
+            print(f"GitHub rate limit low on all tokens, waiting {delay:.0f}s")
+            time.sleep(delay)
+
+    def update(self, token, headers):
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset_at = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset_at is None:
+            return
+        with self._lock:
+            limit = self.limits[token]
+            limit.remaining = int(remaining)
+            limit.reset_at = int(reset_at)
+
+    def backoff(self, token, delay):
+        """Keep a token out of rotation for delay seconds"""
+        with self._lock:
+            limit = self.limits[token]
+            limit.paused_until = max(limit.paused_until, time.time() + delay)
+
+
+class GitHubGraphQL:
+    """Fetch a GitHub profile and all its repositories through the GraphQL API
+
+    Each query returns up to 100 repositories including their languages, so a
+    profile costs one request per 100 repositories instead of one REST call
+    per repository. The GraphQL API always needs a token; queries rotate over
+    the tokens of the pool, whose budgets track the GraphQL quota.
+    """
+
+    def __init__(self, session, tokens, timeout=10):
+        self.session = session
+        self.tokens = tokens
+        self.timeout = timeout
+
+    def query(self, query, variables):
+        token = self.tokens.acquire()
+        response = self.session.post(
+            GITHUB_GRAPHQL_URL,
+            json={'query': query, 'variables': variables},
+            headers={'Authorization': f"bearer {token}"},
+            timeout=self.timeout
+        )
+        self.tokens.update(token, response.headers)
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get('errors'):
+            raise Exception('; '.join(error.get('message', str(error)) for error in payload['errors']))
+        return payload['data']
+
+    def fetch_profile(self, username):
+        """Return the profile in the same shape as the REST scraper"""
+        profile = None
+        repos = []
+        cursor = None
+        while True:
+            user = self.query(PROFILE_QUERY, {'login': username, 'cursor': cursor})['user']
+            if user is None:
+                raise Exception(f"GitHub user not found: {username}")
+            if profile is None:
+                profile = {'name': user['name'], 'bio': user['bio'], 'location': user['location']}
+
+            page = user['repositories']
+            for repo in page['nodes']:
+                repos.append({
+                    'name': repo['name'],
+                    'description': repo['description'],
+                    'stars': repo['stargazerCount'],
+                    'forks': repo['forkCount'],
+                    'url': repo['url'],
+                    'languages': {
+                        edge['node']['name']: edge['size']
+                        for edge in repo['languages']['edges']
+                    }
+                })
+
+            if not page['pageInfo']['hasNextPage']:
+                break
+            cursor = page['pageInfo']['endCursor']
+
+        profile['repositories'] = repos
+        return profile
+
+
+class ConditionalCache:
+    """Persistent ETag/Last-Modified cache of GitHub REST responses
+
+    Responses are stored with their validators and replayed on 304 Not
+    Modified, which GitHub does not count against the rate limit.
+    """
+
+    def __init__(self, path='scraped_data/.cache/github_rest.json'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            self.entries = {}
+        except Exception as e:
+            print(f"Error loading GitHub cache, starting fresh: {e}")
+            self.entries = {}
+
+    def get(self, url):
+        with self._lock:
+            return self.entries.get(url)
+
+    def put(self, url, etag, last_modified, body, next_url=None):
+        with self._lock:
+            self.entries[url] = {
+                'etag': etag, 'last_modified': last_modified, 'body': body, 'next': next_url
+            }
+            self._dirty = True
+
+    def save(self):
+        """Atomically write the cache to disk if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = json.dumps(self.entries, ensure_ascii=False)
+            self._dirty = False
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(snapshot)
+        os.replace(tmp_path, self.path)
+
+
+class GitHubRest:
+    """Minimal GitHub REST client with conditional requests and quota pacing
+
+    Every call uses the token with the most remaining quota in the pool.
+    Per-repository calls run on up to `max_workers` threads that share the
+    pool. A secondary rate limit reply (403/429) takes the token out of
+    rotation for the Retry-After period, or an exponential backoff without
+    one, and the call is retried up to `max_retries` times.
+    """
+
+    def __init__(self, session, tokens=None, cache=None, timeout=10, max_workers=4, max_retries=3):
+        self.session = session
+        self.tokens = tokens or TokenPool([])
+        self.cache = cache
+        self.timeout = timeout
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+
+    @classmethod
+    def from_config(cls, session, config):
+        """Build a client from the 'github' section of the scraper config"""
+        cache_path = config.get('cache_path', 'scraped_data/.cache/github_rest.json')
+        return cls(
+            session,
+            tokens=TokenPool.from_config(config),
+            cache=ConditionalCache(cache_path) if cache_path else None,
+            timeout=config.get('timeout', 10),
+            max_workers=config.get('max_workers', 4),
+            max_retries=config.get('max_retries', 3)
+        )
+
+    @staticmethod
+    def is_rate_limited(response):
+        if response.status_code == 429:
+            return True
+        return response.status_code == 403 and (
+            'Retry-After' in response.headers
+            or response.headers.get('X-RateLimit-Remaining') == '0'
+            or 'rate limit' in response.text.lower()
+        )
+
+    def get(self, url, params=None):
+        """GET a JSON resource, returning (body, url of the next page or None)"""
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()))}"
+        headers = {'Accept': 'application/vnd.github+json'}
+        cached = self.cache.get(url) if self.cache else None
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        for attempt in range(self.max_retries + 1):
+            token = self.tokens.acquire()
+            if token:
+                headers['Authorization'] = f"token {token}"
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            self.tokens.update(token, response.headers)
+            if not self.is_rate_limited(response) or attempt == self.max_retries:
+                break
+            retry_after = response.headers.get('Retry-After')
+            delay = int(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt * 5
+            if response.headers.get('X-RateLimit-Remaining') == '0' and not retry_after:
+                delay = max(delay, int(response.headers.get('X-RateLimit-Reset', 0)) - time.time() + 1)
+            print(f"GitHub rate limited on {url}, retrying in {delay:.0f}s")
+            self.tokens.backoff(token, delay)
+
+        next_url = response.links.get('next', {}).get('url')
+
+        if response.status_code == 304 and cached:
+            return cached['body'], next_url or cached.get('next')
+        response.raise_for_status()
+        body = response.json()
+        etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+        if self.cache is not None and (etag or last_modified):
+            self.cache.put(url, etag, last_modified, body, next_url)
+        return body, next_url
+
+    def get_all(self, url, params=None):
+        """GET every page of a list resource"""
+        items = []
+        while url:
+            page, url = self.get(url, params)
+            items.extend(page)
+            params = None
+        return items
+
+    def fetch_profile(self, username):
+        """Return the profile in the shape of github.json"""
+        user, _ = self.get(f"https://api.github.com/users/{username}")
+        repos = self.get_all(f"https://api.github.com/users/{username}/repos", {'per_page': 100})
+
+        # executor.map keeps repository order
+        languages = []
+        if repos:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(repos))) as executor:
+                languages = list(executor.map(lambda repo: self.get(repo['languages_url'])[0], repos))
+
+        return {
+            'name': user.get('name'),
+            'bio': user.get('bio'),
+            'location': user.get('location'),
+            'repositories': [
+                {
+                    'name': repo['name'],
+                    'description': repo['description'],
+                    'stars': repo['stargazers_count'],
+                    'forks': repo['forks_count'],
+                    'url': repo['html_url'],
+                    'languages': repo_languages
+                }
+                for repo, repo_languages in zip(repos, languages)
+            ]
+        }
@@ -0,0 +1,36 @@
+from bs4 import BeautifulSoup
+
+# 'auto' picks the fastest installed tree builder
+PARSER_BACKENDS = ('auto', 'lxml', 'html.parser', 'html5lib')
+
+
+def resolve_parser(backend='auto'):
+    """Map a configured backend name to a BeautifulSoup tree builder"""
+    backend = backend or 'auto'
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend {backend!r}, expected one of {PARSER_BACKENDS}")
+    if backend != 'auto':
+        return backend
+    return available_backends()[0]
+
+
+def available_backends():
+    """Installed tree builders, fastest first"""
+    backends = []
+    for backend, module in (('lxml', 'lxml'), ('html.parser', None), ('html5lib', 'html5lib')):
+        if module:
+            try:
+                __import__(module)
+            except ImportError:
+                continue
+        backends.append(backend)
+    return backends
+
+
+def make_soup(markup, backend='auto', parse_only=None):
+    """Parse markup with the configured backend
+
+    parse_only takes a SoupStrainer so that only the subtrees an extractor
+    needs are built. html5lib ignores it.
+    """
+    return BeautifulSoup(markup, resolve_parser(backend), parse_only=parse_only)
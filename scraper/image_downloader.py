@@ -0,0 +1,134 @@
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class DownloadResult:
+    """Outcome of a single download"""
+
+    def __init__(self, url, path, ok, size=0, status_code=None, content_type=None,
+                 error=None, duration=0.0, sha256=None, etag=None, last_modified=None):
+        self.url = url
+        self.path = path
+        self.ok = ok
+        self.size = size
+        self.status_code = status_code
+        self.content_type = content_type
+        self.error = error
+        self.duration = duration
+        self.sha256 = sha256
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def not_modified(self):
+        return self.status_code == 304
+
+
+class ImageDownloader:
+    """Shared downloader with connection pooling and bounded concurrency
+
+    One requests.Session is reused for every download, at most
+    `max_workers` downloads run at once and at most `per_host` of them
+    against the same host. Bodies are streamed to a temporary file and only
+    moved into place once complete; anything larger than `max_bytes` is
+    aborted and discarded. The body is hashed while it streams, and a 304
+    reply to a conditional request is reported as an ok, not_modified result
+    without touching `path`.
+    """
+
+    def __init__(self, max_workers=8, per_host=4, timeout=(5, 30), max_bytes=20 * 1024 * 1024,
+                 chunk_size=64 * 1024, user_agent='Mozilla/5.0'):
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = user_agent
+
+        self._host_limits = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a downloader from the 'downloads' section of the scraper config"""
+        return cls(
+            max_workers=config.get('max_workers', 8),
+            per_host=config.get('per_host', 4),
+            timeout=(config.get('connect_timeout', 5), config.get('read_timeout', 30)),
+            max_bytes=config.get('max_mb', 20) * 1024 * 1024
+        )
+
+    def _host_limit(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_limits[host]
+
+    def download(self, url, path, headers=None):
+        """Stream url to path and return a DownloadResult"""
+        start = time.perf_counter()
+        tmp_path = f"{path}.part"
+        size = 0
+        status_code = None
+        content_type = None
+        etag = None
+        last_modified = None
+        digest = hashlib.sha256()
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with self._host_limit(url):
+                with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+                    status_code = response.status_code
+                    content_type = response.headers.get('Content-Type')
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    if status_code == 304:
+                        return DownloadResult(url, None, True, 0, status_code, content_type,
+                                              duration=time.perf_counter() - start,
+                                              etag=etag, last_modified=last_modified)
+                    response.raise_for_status()
+
+                    declared = response.headers.get('Content-Length')
+                    if declared and declared.isdigit() and int(declared) > self.max_bytes:
+                        raise ValueError(f"Content-Length {declared} exceeds limit of {self.max_bytes} bytes")
+
+                    with open(tmp_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=self.chunk_size):
+                            size += len(chunk)
+                            if size > self.max_bytes:
+                                raise ValueError(f"Body exceeds limit of {self.max_bytes} bytes")
+                            digest.update(chunk)
+                            f.write(chunk)
+
+            os.replace(tmp_path, path)
+            return DownloadResult(url, path, True, size, status_code, content_type,
+                                  duration=time.perf_counter() - start, sha256=digest.hexdigest(),
+                                  etag=etag, last_modified=last_modified)
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return DownloadResult(url, path, False, size, status_code, content_type,
+                                  error=str(e), duration=time.perf_counter() - start)
+
+    def map(self, func, items):
+        """Run func over items on the download workers, returning results in input order"""
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,194 @@
+import json
+import mimetypes
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from urllib.parse import urlparse
+
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf
+    except ImportError:
+        pymupdf = None
+
+# Formats the site build copies as they are; other rasters are converted to PNG
+WEB_IMAGE_EXTS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.avif')
+# Names of the files the store places in tag folders
+BLOB_NAME = re.compile(r'^[0-9a-f]{64}\.\w+$')
+
+
+class ImageStore:
+    """Content-addressed image store with a URL manifest
+
+    Images are stored once under `root` as <sha256>.<ext> (sharded by the
+    first two hex digits), so the same picture scraped from several pages is
+    kept a single time and file names no longer depend on page order. The
+    manifest maps each original URL to its blob together with the ETag and
+    Last-Modified validators, which are sent back as conditional request
+    headers on the next run; a 304 reply reuses the stored blob.
+
+    Every blob fetched with a tag is also linked (or copied where hard links
+    are not supported) into `tag_root/<tag>/`, the per-source folders the
+    site build copies images from; formats browsers cannot show are placed
+    there as PNG. Blobs the manifest no longer maps to a tag are removed
+    from its folder after each fetch_many.
+    """
+
+    def __init__(self, downloader, root='scraped_data/images/store',
+                 manifest_path='scraped_data/images/manifest.json', tag_root='scraped_data/images'):
+        self.downloader = downloader
+        self.root = root
+        self.manifest_path = manifest_path
+        self.tag_root = tag_root
+        self._lock = threading.Lock()
+        self.manifest = self._load_manifest()
+
+    @classmethod
+    def from_config(cls, downloader, config):
+        """Build a store from the 'image_store' section of the scraper config"""
+        return cls(
+            downloader,
+            root=config.get('root', 'scraped_data/images/store'),
+            manifest_path=config.get('manifest', 'scraped_data/images/manifest.json'),
+            tag_root=config.get('tag_root', 'scraped_data/images')
+        )
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error loading image manifest, starting fresh: {e}")
+            return {}
+
+    def save_manifest(self):
+        """Atomically write the manifest to disk"""
+        with self._lock:
+            snapshot = json.dumps(self.manifest, indent=2, ensure_ascii=False, sort_keys=True)
+        os.makedirs(os.path.dirname(self.manifest_path) or '.', exist_ok=True)
+        tmp_path = f"{self.manifest_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(snapshot)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _extension(self, url, content_type):
+        if content_type:
+            ext = mimetypes.guess_extension(content_type.split(';')[0].strip())
+            if ext:
+                return '.jpg' if ext in ('.jpe', '.jpeg') else ext
+        ext = os.path.splitext(urlparse(url).path)[1].lower()
+        return ext if ext and len(ext) <= 5 else '.jpg'
+
+    def _blob_path(self, sha256, ext):
+        return os.path.join(self.root, sha256[:2], f"{sha256}{ext}")
+
+    @staticmethod
+    def _tag_name(blob_path):
+        """File name of a blob in a tag folder"""
+        name = os.path.basename(blob_path)
+        stem, ext = os.path.splitext(name)
+        if ext.lower() in WEB_IMAGE_EXTS or pymupdf is None:
+            return name
+        return f"{stem}.png"
+
+    def _place(self, blob_path, tag):
+        """Make the blob available in the folder of its tag"""
+        folder = os.path.join(self.tag_root, tag)
+        name = self._tag_name(blob_path)
+        path = os.path.join(folder, name)
+        if os.path.exists(path):
+            return
+        os.makedirs(folder, exist_ok=True)
+        if name != os.path.basename(blob_path):
+            pixmap = pymupdf.Pixmap(blob_path)
+            if pixmap.n - pixmap.alpha > 3:
+                pixmap = pymupdf.Pixmap(pymupdf.csRGB, pixmap)
+            pixmap.save(path, 'png')
+            return
+        try:
+            os.link(blob_path, path)
+        except OSError:
+            shutil.copy2(blob_path, path)
+
+    def prune(self, tag):
+        """Remove blobs from a tag folder that the manifest no longer maps to the tag"""
+        folder = os.path.join(self.tag_root, tag)
+        if not os.path.isdir(folder):
+            return
+        with self._lock:
+            wanted = {
+                self._tag_name(entry['path']) for entry in self.manifest.values()
+                if tag in entry.get('tags', []) and entry.get('path')
+            }
+        for name in os.listdir(folder):
+            if BLOB_NAME.match(name) and name not in wanted:
+                os.remove(os.path.join(folder, name))
+
+    def fetch(self, url, tag=None, headers=None):
+        """Fetch url into the store and return a DownloadResult pointing at its blob"""
+        with self._lock:
+            entry = dict(self.manifest.get(url, {}))
+
+        request_headers = dict(headers or {})
+        if entry.get('path') and os.path.exists(entry['path']):
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        tmp_path = os.path.join(self.root, 'tmp', uuid.uuid4().hex)
+        result = self.downloader.download(url, tmp_path, request_headers)
+
+        if result.not_modified:
+            result.path = entry['path']
+            result.sha256 = entry.get('sha256')
+            result.size = entry.get('size', 0)
+            result.content_type = entry.get('content_type')
+        elif result.ok:
+            blob_path = self._blob_path(result.sha256, self._extension(url, result.content_type))
+            if os.path.exists(blob_path):
+                # Same bytes already stored, possibly under another URL
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                os.replace(tmp_path, blob_path)
+            result.path = blob_path
+        else:
+            return result
+
+        tags = set(entry.get('tags', []))
+        if tag:
+            tags.add(tag)
+            if self.tag_root:
+                try:
+                    self._place(result.path, tag)
+                except Exception as e:
+                    print(f"Error placing {result.path} in {tag}: {e}")
+        with self._lock:
+            self.manifest[url] = {
+                'path': result.path,
+                'sha256': result.sha256,
+                'size': result.size,
+                'content_type': result.content_type,
+                'etag': result.etag or entry.get('etag'),
+                'last_modified': result.last_modified or entry.get('last_modified'),
+                'tags': sorted(tags),
+                'checked_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+        return result
+
+    def fetch_many(self, urls, tag=None, headers=None):
+        """Fetch urls concurrently and persist the manifest, returning results in input order"""
+        results = self.downloader.map(lambda url: self.fetch(url, tag, headers), urls)
+        if results:
+            self.save_manifest()
+            if tag and self.tag_root:
+                self.prune(tag)
+        return results
@@ -1,252 +1,352 @@
+import argparse
 import os
-from bs4 import BeautifulSoup
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import SoupStrainer, Tag
 import json
+from html_parser import make_soup
 
-def print_html_structure(soup, filename):
+# Only these subtrees are searched by the extractors and the structure dump,
+# so parsing just them yields the same find_all results as the full page
+LINKEDIN_STRAINER = SoupStrainer(class_=[
+    'pvs-entity', 'pvs-list__outer-container', 'artdeco-list__item', 'visually-hidden'
+])
+
+# Declarative description of every section. A page is routed to the first
+# section whose keywords appear in its file name. 'entity' sections are lists
+# of pvs-entity cards whose first visually-hidden span holds the fields
+# joined by ' · '.
+SECTION_SPECS = {
+    'experience': {
+        'keywords': ('experience',),
+        'kind': 'entity',
+        'fields': ('title', 'company', 'duration', 'location'),
+        'label': 'experience entries'
+    },
+    'education': {
+        'keywords': ('education',),
+        'kind': 'entity',
+        'fields': ('school', 'degree', 'field', 'dates'),
+        'label': 'education entries'
+    },
+    'certifications': {
+        'keywords': ('certifications', 'licenses'),
+        'kind': 'certifications',
+        'label': 'certification entries'
+    },
+    'skills': {
+        'keywords': ('skills',),
+        'kind': 'skills',
+        'label': 'skills'
+    },
+    'projects': {
+        'keywords': ('projects',),
+        'kind': 'entity',
+        'fields': ('name', 'description', 'date'),
+        'label': 'project entries'
+    },
+    'publications': {
+        'keywords': ('publications',),
+        'kind': 'entity',
+        'fields': ('title', 'publisher', 'date', 'description'),
+        'label': 'publication entries'
+    }
+}
+
+class PageIndex:
+    """Tag/class index of a parsed page built in a single traversal
+
+    Every tag gets its pre-order position and the position of the last tag in
+    its subtree, so "descendants of X matching Y" is a binary search over the
+    positions of Y instead of another walk of the tree. Lookups follow
+    BeautifulSoup's class matching: a single class matches any class token,
+    a space-separated string matches the whole class attribute.
+    """
+
+    def __init__(self, soup):
+        self.tags = []
+        self.end = []
+        self._positions = {}
+        self._by_class = defaultdict(list)
+
+        stack = [(soup, -1)]
+        for tag in soup.descendants:
+            if not isinstance(tag, Tag):
+                continue
+            pos = len(self.tags)
+            # Close every open subtree that is not an ancestor of this tag
+            while stack[-1][0] is not tag.parent:
+                _, closed = stack.pop()
+                self.end[closed] = pos - 1
+            stack.append((tag, pos))
+
+            self.tags.append(tag)
+            self.end.append(pos)
+            self._positions[id(tag)] = pos
+            classes = tag.get('class') or []
+            for cls in classes:
+                self._by_class[(tag.name, cls)].append(pos)
+            if len(classes) > 1:
+                self._by_class[(tag.name, ' '.join(classes))].append(pos)
+
+        last = len(self.tags) - 1
+        for _, pos in stack[1:]:
+            self.end[pos] = last
+
+    def find_all(self, name, class_, within=None):
+        """Tags with this name and class, optionally limited to descendants of within"""
+        positions = self._by_class.get((name, class_), [])
+        if within is not None:
+            start = self._positions[id(within)]
+            positions = positions[bisect_right(positions, start):bisect_right(positions, self.end[start])]
+        return [self.tags[pos] for pos in positions]
+
+    def find(self, name, class_, within=None):
+        """First matching tag, or None"""
+        positions = self._by_class.get((name, class_), [])
+        if within is None:
+            return self.tags[positions[0]] if positions else None
+        start = self._positions[id(within)]
+        i = bisect_left(positions, start + 1)
+        if i < len(positions) and positions[i] <= self.end[start]:
+            return self.tags[positions[i]]
+        return None
+
+def print_html_structure(index, filename):
     """Print HTML structure to help debug selectors"""
     print(f"\nAnalyzing HTML structure for {filename}...")
-    
+
     # Check for main containers
-    containers = soup.find_all('div', {'class': 'pvs-list__outer-container'})
+    containers = index.find_all('div', 'pvs-list__outer-container')
     print(f"Found {len(containers)} outer containers")
-    
+
     # Check for list items
-    list_items = soup.find_all('li', {'class': 'artdeco-list__item'})
+    list_items = index.find_all('li', 'artdeco-list__item')
     print(f"Found {len(list_items)} list items")
-    
+
     # Check for text elements
-    visually_hidden = soup.find_all('span', {'class': 'visually-hidden'})
+    visually_hidden = index.find_all('span', 'visually-hidden')
     print(f"Found {len(visually_hidden)} visually-hidden spans")
-    
+
     # Print sample of first item if found
     if list_items:
         print("\nSample list item structure:")
         print(list_items[0].prettify())
 
-def scrape_linkedin_local_pages(pages_folder):
-    """Scrape LinkedIn information from locally saved HTML pages"""
-    data = {
-        'experience': [],
-        'education': [],
-        'certifications': [],
-        'skills': [],
-        'projects': [],
-        'publications': []
+def parse_linkedin_page(markup, parser='auto', partial=True):
+    """Parse a saved LinkedIn page, keeping only the subtrees the extractors use"""
+    return make_soup(markup, parser, parse_only=LINKEDIN_STRAINER if partial else None)
+
+def section_for_file(filename):
+    """Name of the section a saved page holds, based on its file name"""
+    lowered = filename.lower()
+    for section, spec in SECTION_SPECS.items():
+        if any(keyword in lowered for keyword in spec['keywords']):
+            return section
+    return None
+
+def process_page(file_path, section, parser='auto', partial=True, debug=False):
+    """Parse and extract one saved page; runs in a worker process when parallel
+
+    Returns (section, entries, timings) where timings holds the parse and
+    extract durations in seconds.
+    """
+    filename = os.path.basename(file_path)
+    print(f"\nProcessing {filename}...")
+
+    start = time.perf_counter()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        index = PageIndex(parse_linkedin_page(f.read(), parser, partial))
+    parsed = time.perf_counter()
+
+    # Print HTML structure for debugging
+    if debug:
+        print_html_structure(index, filename)
+
+    entries = extract_section(index, section)
+    return section, entries, {
+        'file': filename,
+        'parse': parsed - start,
+        'extract': time.perf_counter() - parsed
     }
-    
+
+def print_timings(timings):
+    """Print per-file parse/extract times"""
+    print("\nPer-file timings:")
+    for timing in timings:
+        print(f"  {timing['file']}: parse {timing['parse'] * 1000:.1f} ms, "
+              f"extract {timing['extract'] * 1000:.1f} ms")
+
+def scrape_linkedin_local_pages(pages_folder, parser='auto', partial=True, debug=False, workers=1):
+    """Scrape LinkedIn information from locally saved HTML pages
+
+    With workers > 1 (or 0 for one per CPU) pages are parsed in a process
+    pool. Files are handled in sorted name order and the entries of several
+    files for the same section are concatenated in that order, so the result
+    does not depend on scheduling.
+    """
+    data = {section: [] for section in SECTION_SPECS}
+
     try:
-        for filename in os.listdir(pages_folder):
+        jobs = []
+        for filename in sorted(os.listdir(pages_folder)):
             if not filename.endswith('.html'):
                 continue
-                
-            file_path = os.path.join(pages_folder, filename)
-            print(f"\nProcessing {filename}...")
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                soup = BeautifulSoup(f.read(), 'html.parser')
-            
-            # Print HTML structure for debugging
-            print_html_structure(soup, filename)
-            
-            # Extract data based on file name
-            if 'experience' in filename.lower():
-                data['experience'] = extract_experience(soup)
-            elif 'education' in filename.lower():
-                data['education'] = extract_education(soup)
-            elif 'certifications' in filename.lower() or 'licenses' in filename.lower():
-                data['certifications'] = extract_certifications(soup)
-            elif 'skills' in filename.lower():
-                data['skills'] = extract_skills(soup)
-            elif 'projects' in filename.lower():
-                data['projects'] = extract_projects(soup)
-            elif 'publications' in filename.lower():
-                data['publications'] = extract_publications(soup)
-        
+
+            section = section_for_file(filename)
+            if section is not None:
+                jobs.append((os.path.join(pages_folder, filename), section))
+
+        if workers == 1 or len(jobs) <= 1:
+            results = [process_page(path, section, parser, partial, debug) for path, section in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers or None) as executor:
+                futures = [
+                    executor.submit(process_page, path, section, parser, partial, debug)
+                    for path, section in jobs
+                ]
+                results = [future.result() for future in futures]
+
+        for section, entries, _ in results:
+            data[section].extend(entries)
+        print_timings([timing for _, _, timing in results])
+
         # Save the extracted data
         os.makedirs('scraped_data', exist_ok=True)
         with open('scraped_data/linkedin.json', 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
-            
+
         print("\nData extraction complete. Saved to scraped_data/linkedin.json")
         return data
-        
+
     except Exception as e:
         print(f"Error processing LinkedIn pages: {e}")
         return None
 
-def extract_experience(soup):
-    """Extract experience information"""
-    experience = []
+def extract_section(index, section):
+    """Extract one section from an indexed page according to its spec"""
+    spec = SECTION_SPECS[section]
+    extractor = {
+        'entity': extract_entities,
+        'certifications': extract_certification_items,
+        'skills': extract_skill_items
+    }[spec['kind']]
+
+    entries = []
     try:
-        exp_items = soup.find_all('div', {'class': 'pvs-entity'})
-        for item in exp_items:
-            # Get title and company
-            title_elem = item.find('span', {'class': 'visually-hidden'})
-            if title_elem:
-                title_text = title_elem.text.strip()
-                # Split text as LinkedIn combines title and company
-                parts = [part.strip() for part in title_text.split(' · ')]
-                
-                exp_data = {
-                    'title': parts[0],
-                    'company': parts[1] if len(parts) > 1 else '',
-                    'duration': parts[2] if len(parts) > 2 else '',
-                    'location': parts[3] if len(parts) > 3 else ''
-                }
-                experience.append(exp_data)
-        
-        print(f"Found {len(experience)} experience entries")
+        entries = extractor(index, spec)
+        print(f"Found {len(entries)} {spec['label']}")
     except Exception as e:
-        print(f"Error extracting experience: {e}")
-    return experience
+        print(f"Error extracting {section}: {e}")
+    return entries
+
+def extract_entities(index, spec):
+    """Map the ' · '-separated title of every pvs-entity card onto the spec fields"""
+    fields = spec['fields']
+    entries = []
+    for item in index.find_all('div', 'pvs-entity'):
+        title_elem = index.find('span', 'visually-hidden', within=item)
+        if title_elem:
+            parts = [part.strip() for part in title_elem.text.strip().split(' · ')]
+            entries.append({
+                field: parts[i] if len(parts) > i else ''
+                for i, field in enumerate(fields)
+            })
+    return entries
+
+def extract_certification_items(index, spec):
+    """Extract certifications from the first pvs-list container"""
+    certifications = []
+    containers = index.find_all('div', 'pvs-list__outer-container')
+    if containers:
+        # Get all list items within the container
+        for item in index.find_all('li', 'artdeco-list__item', within=containers[0]):
+            try:
+                # Get the main text content
+                title_elem = index.find('div', 'display-flex align-items-center', within=item)
+                if title_elem:
+                    name_elem = index.find('span', 'visually-hidden', within=title_elem)
+                    if name_elem:
+                        cert_text = name_elem.text.strip()
+
+                        # Get additional details if they exist
+                        details_elem = index.find('span', 't-14 t-normal', within=item)
+                        details_text = details_elem.text.strip() if details_elem else ''
+
+                        # Get date if it exists
+                        date_elem = index.find('span', 't-14 t-normal t-black--light', within=item)
+                        date_text = date_elem.text.strip() if date_elem else ''
+
+                        # Split main text and combine with other details
+                        parts = [part.strip() for part in cert_text.split(' · ')]
+
+                        cert_data = {
+                            'name': parts[0],
+                            'issuer': parts[1] if len(parts) > 1 else details_text,
+                            'issued_date': parts[2] if len(parts) > 2 else date_text,
+                            'credential_id': parts[3] if len(parts) > 3 else ''
+                        }
+                        certifications.append(cert_data)
+                        print(f"Found certification: {cert_data['name']}")
+            except Exception as e:
+                print(f"Error processing individual certification: {e}")
+
+    # Debug output
+    if not certifications:
+        print("No certifications found. Checking HTML structure...")
+        print(f"Found {len(containers)} outer containers")
+
+        if containers:
+            items = index.find_all('li', 'artdeco-list__item', within=containers[0])
+            print(f"Found {len(items)} list items")
+
+            if items:
+                print("Sample item HTML structure:")
+                print(items[0].prettify()[:500])  # Print first 500 chars of first item
+
+    return certifications
+
+def extract_skill_items(index, spec):
+    """Every visually-hidden span that is not a 'show more' style control"""
+    skills = []
+    for item in index.find_all('span', 'visually-hidden'):
+        skill_text = item.text.strip()
+        if skill_text and not any(x in skill_text.lower() for x in ['show', 'more', 'all']):
+            skills.append(skill_text)
+    return skills
+
+def extract_experience(soup):
+    """Extract experience information"""
+    return extract_section(PageIndex(soup), 'experience')
 
 def extract_education(soup):
     """Extract education information"""
-    education = []
-    try:
-        edu_items = soup.find_all('div', {'class': 'pvs-entity'})
-        for item in edu_items:
-            title_elem = item.find('span', {'class': 'visually-hidden'})
-            if title_elem:
-                edu_text = title_elem.text.strip()
-                parts = [part.strip() for part in edu_text.split(' · ')]
-                
-                edu_data = {
-                    'school': parts[0],
-                    'degree': parts[1] if len(parts) > 1 else '',
-                    'field': parts[2] if len(parts) > 2 else '',
-                    'dates': parts[3] if len(parts) > 3 else ''
-                }
-                education.append(edu_data)
-        
-        print(f"Found {len(education)} education entries")
-    except Exception as e:
-        print(f"Error extracting education: {e}")
-    return education
+    return extract_section(PageIndex(soup), 'education')
 
 def extract_certifications(soup):
     """Extract certifications information"""
-    certifications = []
-    try:
-        # Try multiple possible selectors for certification items
-        cert_items = soup.find_all('div', {'class': 'pvs-list__outer-container'})
-        if cert_items:
-            # Get all list items within the container
-            cert_items = cert_items[0].find_all('li', {'class': 'artdeco-list__item'})
-            
-            for item in cert_items:
-                try:
-                    # Get the main text content
-                    title_elem = item.find('div', {'class': 'display-flex align-items-center'})
-                    if title_elem:
-                        name_elem = title_elem.find('span', {'class': 'visually-hidden'})
-                        if name_elem:
-                            cert_text = name_elem.text.strip()
-                            
-                            # Get additional details if they exist
-                            details_elem = item.find('span', {'class': 't-14 t-normal'})
-                            details_text = details_elem.text.strip() if details_elem else ''
-                            
-                            # Get date if it exists
-                            date_elem = item.find('span', {'class': 't-14 t-normal t-black--light'})
-                            date_text = date_elem.text.strip() if date_elem else ''
-                            
-                            # Split main text and combine with other details
-                            parts = [part.strip() for part in cert_text.split(' · ')]
-                            
-                            cert_data = {
-                                'name': parts[0],
-                                'issuer': parts[1] if len(parts) > 1 else details_text,
-                                'issued_date': parts[2] if len(parts) > 2 else date_text,
-                                'credential_id': parts[3] if len(parts) > 3 else ''
-                            }
-                            certifications.append(cert_data)
-                            print(f"Found certification: {cert_data['name']}")
-                except Exception as e:
-                    print(f"Error processing individual certification: {e}")
-        
-        print(f"Found {len(certifications)} certification entries")
-        
-        # Debug output
-        if not certifications:
-            print("No certifications found. Checking HTML structure...")
-            containers = soup.find_all('div', {'class': 'pvs-list__outer-container'})
-            print(f"Found {len(containers)} outer containers")
-            
-            if containers:
-                items = containers[0].find_all('li', {'class': 'artdeco-list__item'})
-                print(f"Found {len(items)} list items")
-                
-                if items:
-                    print("Sample item HTML structure:")
-                    print(items[0].prettify()[:500])  # Print first 500 chars of first item
-                
-    except Exception as e:
-        print(f"Error extracting certifications: {e}")
-    
-    return certifications
+    return extract_section(PageIndex(soup), 'certifications')
 
 def extract_skills(soup):
     """Extract skills information"""
-    skills = []
-    try:
-        skill_items = soup.find_all('span', {'class': 'visually-hidden'})
-        for item in skill_items:
-            skill_text = item.text.strip()
-            if skill_text and not any(x in skill_text.lower() for x in ['show', 'more', 'all']):
-                skills.append(skill_text)
-        
-        print(f"Found {len(skills)} skills")
-    except Exception as e:
-        print(f"Error extracting skills: {e}")
-    return skills
+    return extract_section(PageIndex(soup), 'skills')
 
 def extract_projects(soup):
     """Extract projects information"""
-    projects = []
-    try:
-        project_items = soup.find_all('div', {'class': 'pvs-entity'})
-        for item in project_items:
-            title_elem = item.find('span', {'class': 'visually-hidden'})
-            if title_elem:
-                project_text = title_elem.text.strip()
-                parts = [part.strip() for part in project_text.split(' · ')]
-                
-                project_data = {
-                    'name': parts[0],
-                    'description': parts[1] if len(parts) > 1 else '',
-                    'date': parts[2] if len(parts) > 2 else ''
-                }
-                projects.append(project_data)
-        
-        print(f"Found {len(projects)} project entries")
-    except Exception as e:
-        print(f"Error extracting projects: {e}")
-    return projects
+    return extract_section(PageIndex(soup), 'projects')
 
 def extract_publications(soup):
     """Extract publications information"""
-    publications = []
-    try:
-        pub_items = soup.find_all('div', {'class': 'pvs-entity'})
-        for item in pub_items:
-            title_elem = item.find('span', {'class': 'visually-hidden'})
-            if title_elem:
-                pub_text = title_elem.text.strip()
-                parts = [part.strip() for part in pub_text.split(' · ')]
-                
-                pub_data = {
-                    'title': parts[0],
-                    'publisher': parts[1] if len(parts) > 1 else '',
-                    'date': parts[2] if len(parts) > 2 else '',
-                    'description': parts[3] if len(parts) > 3 else ''
-                }
-                publications.append(pub_data)
-        
-        print(f"Found {len(publications)} publication entries")
-    except Exception as e:
-        print(f"Error extracting publications: {e}")
-    return publications
+    return extract_section(PageIndex(soup), 'publications')
 
 if __name__ == "__main__":
-    scrape_linkedin_local_pages('linked_pages') 
\ No newline at end of file
+    arg_parser = argparse.ArgumentParser(description="Extract LinkedIn data from saved HTML pages")
+    arg_parser.add_argument('pages_folder', nargs='?', default='linked_pages')
+    arg_parser.add_argument('--parser', default='auto', help="HTML parser backend")
+    arg_parser.add_argument('--full-parse', action='store_true', help="parse whole pages instead of only the used subtrees")
+    arg_parser.add_argument('--debug', action='store_true', help="print the HTML structure of every page")
+    arg_parser.add_argument('--workers', type=int, default=1, help="worker processes, 0 for one per CPU")
+    args = arg_parser.parse_args()
+    scrape_linkedin_local_pages(args.pages_folder, args.parser, not args.full_parse, args.debug, args.workers)
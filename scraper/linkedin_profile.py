@@ -0,0 +1,61 @@
+# Profile sections read from the live page: the XPath of the section and the
+# fields its items' visually-hidden texts map to, in order
+PROFILE_SECTIONS = {
+    'certifications': {
+        'xpath': "//section[contains(.//span/text(), 'Certifications') or contains(.//span/text(), 'Licenses')]",
+        'fields': ('name', 'issuer', 'date'),
+        'label': 'certification'
+    },
+    'projects': {
+        'xpath': "//section[contains(.//span/text(), 'Projects')]",
+        'fields': ('name', 'description', 'date'),
+        'label': 'project'
+    }
+}
+
+# For every {name: section XPath} returns the non-empty visually-hidden texts
+# of each list item in that section, in document order
+SECTION_ITEMS_SCRIPT = """
+var sections = arguments[0];
+var result = {};
+Object.keys(sections).forEach(function (name) {
+    var items = document.evaluate(
+        sections[name] + "//div[contains(@class, 'pvs-list')]//li",
+        document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    result[name] = [];
+    for (var i = 0; i < items.snapshotLength; i++) {
+        var texts = [];
+        items.snapshotItem(i).querySelectorAll('span.visually-hidden').forEach(function (span) {
+            var text = (span.innerText || span.textContent || '').trim();
+            if (text) {
+                texts.push(text);
+            }
+        });
+        result[name].push(texts);
+    }
+});
+return result;
+"""
+
+
+def extract_profile_sections(driver, sections=PROFILE_SECTIONS):
+    """Read every profile section in one script execution
+
+    Returns {section: [record, ...]} with each list item's texts mapped onto
+    the section's fields; items without text are skipped.
+    """
+    items = driver.execute_script(
+        SECTION_ITEMS_SCRIPT, {name: spec['xpath'] for name, spec in sections.items()}
+    )
+    data = {}
+    for name, spec in sections.items():
+        records = []
+        for texts in items.get(name) or []:
+            if texts:
+                records.append({
+                    field: texts[i] if len(texts) > i else ''
+                    for i, field in enumerate(spec['fields'])
+                })
+        print(f"Found {len(items.get(name) or [])} {spec['label']} items")
+        data[name] = records
+    return data
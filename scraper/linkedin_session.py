@@ -0,0 +1,99 @@
+import os
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+LINKEDIN_LOGIN_URL = "https://www.linkedin.com/login"
+LINKEDIN_FEED_URL = "https://www.linkedin.com/feed/"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+
+# Where LinkedIn sends visitors without a valid session
+LOGGED_OUT_MARKERS = ('/login', '/authwall', '/uas/', '/checkpoint/lg/', 'session_redirect')
+
+
+class LinkedInSession:
+    """Chrome driver for LinkedIn with a session that survives between runs
+
+    The driver uses its own persistent user-data-dir, so the cookies of a
+    successful login are reused by the next run. ensure_logged_in() checks
+    the session by opening the feed and only goes through the login form
+    when LinkedIn redirects to it.
+    """
+
+    def __init__(self, username, password, profile_dir='scraped_data/.cache/linkedin_profile', headless=True,
+                 page_load_timeout=30):
+        self.username = username
+        self.password = password
+        self.profile_dir = profile_dir
+        self.headless = headless
+        self.page_load_timeout = page_load_timeout
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a session from the 'linkedin' section of the scraper config"""
+        return cls(
+            os.path.expandvars(config.get('username', '')),
+            os.path.expandvars(config.get('password', '')),
+            profile_dir=config.get('profile_dir', 'scraped_data/.cache/linkedin_profile'),
+            headless=config.get('headless', True),
+            page_load_timeout=config.get('page_load_timeout', 30)
+        )
+
+    def start_driver(self):
+        chrome_options = Options()
+        if self.headless:
+            chrome_options.add_argument('--headless')
+        if self.profile_dir:
+            path = os.path.abspath(self.profile_dir)
+            os.makedirs(path, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={path}")
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_argument('--disable-notifications')
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": USER_AGENT})
+        if self.page_load_timeout:
+            driver.set_page_load_timeout(self.page_load_timeout)
+            driver.set_script_timeout(self.page_load_timeout)
+        return driver
+
+    @staticmethod
+    def logged_out(url):
+        return any(marker in url for marker in LOGGED_OUT_MARKERS)
+
+    def is_logged_in(self, driver, waiter):
+        """Open the feed and report whether LinkedIn kept us there"""
+        driver.get(LINKEDIN_FEED_URL)
+        waiter.until('session check', lambda d: '/feed' in d.current_url or self.logged_out(d.current_url))
+        return not self.logged_out(driver.current_url)
+
+    def login(self, driver, waiter):
+        driver.get(LINKEDIN_LOGIN_URL)
+        username_elem = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.ID, "username"))
+        )
+        password_elem = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.ID, "password"))
+        )
+
+        username_elem.send_keys(self.username)
+        password_elem.send_keys(self.password)
+
+        signin_button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
+        )
+        signin_button.click()
+        if not waiter.until('login', lambda d: not self.logged_out(d.current_url)):
+            print(f"LinkedIn login did not complete (now at {driver.current_url})")
+
+    def ensure_logged_in(self, driver, waiter):
+        """Reuse the stored session when it is still valid, log in otherwise"""
+        if self.profile_dir and self.is_logged_in(driver, waiter):
+            print("Reusing saved LinkedIn session")
+            return
+        print("Logging in to LinkedIn...")
+        self.login(driver, waiter)
@@ -1,5 +1,8 @@
+import argparse
 import json
 from content_scraper import ContentScraper
+from stage_scheduler import StageScheduler
+from run_manifest import RunManifest, http_fingerprint, file_fingerprints
 import os
 from pathlib import Path
 
@@ -9,73 +12,194 @@ def save_data(data, filename):
     with open(f'scraped_data/{filename}.json', 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=4, ensure_ascii=False)
 
+def load_data(filename):
+    """Load previously scraped data, or None if it is missing or unreadable"""
+    try:
+        with open(f'scraped_data/{filename}.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+def build_scheduler(scraper, config, manifest, incremental=False, youtube_backfill=False):
+    """Declare the scrape stages and the dependencies between them
+
+    Every stage records a fingerprint of its source in the run manifest.
+    With incremental=True a stage whose fingerprint is unchanged reuses its
+    previous output instead of scraping again, and YouTube only fetches
+    uploads newer than the saved ones. youtube_backfill re-lists the whole
+    channel once.
+    """
+    urls = config['urls']
+    scheduler_config = config.get('scheduler', {})
+    scheduler = StageScheduler(
+        max_workers=scheduler_config.get('max_workers', 4),
+        default_timeout=scheduler_config.get('stage_timeout')
+    )
+
+    def reuse_previous(name, fingerprint, filename):
+        if not incremental or not manifest.unchanged(name, fingerprint):
+            return None
+        previous = load_data(filename)
+        if previous is not None:
+            print(f"Skipping {name}: source unchanged since last run")
+            manifest.mark_skipped(name)
+        return previous
+
+    def scrape_and_save(name, fingerprint, scrape, *args):
+        fingerprint = fingerprint() if fingerprint else None
+        previous = reuse_previous(name, fingerprint, name)
+        if previous is not None:
+            return previous
+        data = scrape(*args)
+        if data is not None:
+            save_data(data, name)
+            manifest.record(name, fingerprint)
+        return data
+
+    def url_fingerprint(url):
+        return lambda: http_fingerprint(scraper.downloader.session, url)
+
+    # Company page first, then its images are attached to the same record
+    def company():
+        fingerprint = url_fingerprint(urls['company'])()
+        previous = reuse_previous('company', fingerprint, 'company')
+        if previous is not None:
+            return previous
+        data = scraper.scrape_company_website(urls['company'])
+        if data is not None:
+            data['_fingerprint'] = fingerprint
+        return data
+
+    def company_images(company_data):
+        if 'company' in manifest.skipped:
+            return company_data
+        fingerprint = company_data.pop('_fingerprint', None)
+        company_data['saved_images'] = scraper.save_images(urls['company'], 'company')
+        save_data(company_data, 'company')
+        manifest.record('company', fingerprint)
+        return company_data
+
+    def local_pdfs():
+        docs_folder = Path('docs')
+        pdf_paths = sorted(docs_folder.glob('**/*.pdf'))
+        previous_files = (manifest.fingerprint('local_pdfs') or {}).get('files', {})
+        fingerprint = {'files': file_fingerprints(pdf_paths, previous_files)}
+        previous = reuse_previous('local_pdfs', fingerprint, 'local_pdfs')
+        if previous is not None:
+            return previous
+
+        # Partial update: keep records of PDFs whose content did not change
+        reuse = {}
+        if incremental:
+            for record in load_data('local_pdfs') or []:
+                path = record.get('path')
+                old, new = previous_files.get(path), fingerprint['files'].get(path)
+                if old and new and old['sha256'] == new['sha256']:
+                    reuse[path] = record
+            if reuse:
+                print(f"Reusing {len(reuse)} unchanged PDF(s)")
+
+        data = scraper.scrape_local_pdfs(docs_folder, reuse=reuse)
+        if data is not None:
+            save_data(data, 'local_pdfs')
+            manifest.record('local_pdfs', fingerprint)
+        return data
+
+    # The incremental listing stops at the first saved upload, so it doubles
+    # as the change check; its newest upload is recorded as the fingerprint
+    def youtube():
+        previous = load_data('youtube') if incremental and not youtube_backfill else None
+        if previous is not None and not previous.get('videos'):
+            previous = None
+        data = scraper.scrape_youtube_channel(urls['youtube'], previous, youtube_backfill)
+        if data is not None:
+            save_data(data, 'youtube')
+            manifest.record('youtube', {'latest_video_id': data['last_video_id']})
+        return data
+
+    # The CV download itself is conditional, so no separate HEAD request is needed
+    def cv():
+        previous = load_data('cv') if incremental else None
+        data = scraper.scrape_cv_pdf(urls['cv'], previous)
+        if data is None:
+            return None
+        if data is previous:
+            manifest.mark_skipped('cv')
+        else:
+            save_data(data, 'cv')
+        manifest.record('cv', {'etag': data.get('etag'), 'last_modified': data.get('last_modified')})
+        return data
+
+    def app_screenshots(app_data):
+        if 'autosol_app' in manifest.skipped:
+            return app_data.get('screenshots', [])
+        return scraper.scrape_app_screenshots(urls['autosol_app'])
+
+    # Browser stages lease drivers from the scraper's pool, which bounds their concurrency
+    scheduler.add_stage('company', company)
+    scheduler.add_stage('company_images', company_images, depends_on=('company',))
+    scheduler.add_stage('youtube', youtube)
+    # LinkedIn offers no cheap change marker, so it is always scraped
+    scheduler.add_stage('linkedin', lambda: scrape_and_save(
+        'linkedin', None, scraper.scrape_linkedin_profile, urls['linkedin']))
+    scheduler.add_stage('github', lambda: scrape_and_save(
+        'github', lambda: scraper.github_fingerprint(urls['github']),
+        scraper.scrape_github_profile, urls['github']))
+    scheduler.add_stage('cv', cv)
+    scheduler.add_stage('company_info', lambda: scrape_and_save(
+        'company_info', url_fingerprint(urls['company_info']),
+        scraper.scrape_signalhire_company, urls['company_info']))
+    scheduler.add_stage('autosol_app', lambda: scrape_and_save(
+        'autosol_app', url_fingerprint(urls['autosol_app']),
+        scraper.scrape_app_info, urls['autosol_app']))
+    scheduler.add_stage('local_pdfs', local_pdfs)
+    # Reuses the page rendered for autosol_app, so it runs after it
+    scheduler.add_stage('app_screenshots', app_screenshots, depends_on=('autosol_app',))
+
+    return scheduler
+
 def main():
+    parser = argparse.ArgumentParser(description="Scrape portfolio content into scraped_data/")
+    parser.add_argument('--incremental', action='store_true',
+                        help="skip sources whose fingerprint is unchanged since the last run")
+    parser.add_argument('--youtube-backfill', action='store_true',
+                        help="list every upload of the YouTube channel instead of the newest ones")
+    args = parser.parse_args()
+
     # Initialize scraper
     scraper = ContentScraper('config/scraper_config.json')
-    
+    manifest = RunManifest('scraped_data/run_manifest.json')
+
     # Load configuration
     with open('config/scraper_config.json', 'r') as f:
         config = json.load(f)
-    
+
     try:
         # Create image directories
         os.makedirs('scraped_data/images', exist_ok=True)
-        
-        # Scrape company website and save images
-        print("Scraping company website...")
-        company_data = scraper.scrape_company_website(config['urls']['company'])
-        company_images = scraper.save_images(config['urls']['company'], 'company')
-        company_data['saved_images'] = company_images
-        save_data(company_data, 'company')
-        
-        # Scrape YouTube channel
-        print("Scraping YouTube channel...")
-        youtube_data = scraper.scrape_youtube_channel(config['urls']['youtube'])
-        save_data(youtube_data, 'youtube')
-        
-        # Scrape LinkedIn profile
-        print("Scraping LinkedIn profile...")
-        linkedin_data = scraper.scrape_linkedin_profile(config['urls']['linkedin'])
-        save_data(linkedin_data, 'linkedin')
-        
-        # Scrape GitHub profile
-        print("Scraping GitHub profile...")
-        github_data = scraper.scrape_github_profile(config['urls']['github'])
-        save_data(github_data, 'github')
-        
-        # Scrape CV
-        print("Scraping CV...")
-        cv_data = scraper.scrape_cv_pdf(config['urls']['cv'])
-        save_data(cv_data, 'cv')
-        
-        # Scrape SignalHire company info
-        print("Scraping company info from SignalHire...")
-        company_info_data = scraper.scrape_signalhire_company(config['urls']['company_info'])
-        save_data(company_info_data, 'company_info')
-        
-        # Scrape app info and save screenshots
-        print("Scraping app info...")
-        app_data = scraper.scrape_app_info(config['urls']['autosol_app'])
-        save_data(app_data, 'autosol_app')
-        
-        # Scrape local PDFs
-        print("Scraping local PDFs...")
-        docs_folder = Path('docs')
-        local_pdfs_data = scraper.scrape_local_pdfs(docs_folder)
-        save_data(local_pdfs_data, 'local_pdfs')
-        
-        # Scrape app screenshots
-        print("Scraping app screenshots...")
-        app_screenshots = scraper.scrape_app_screenshots(config['urls']['autosol_app'])
-        if app_screenshots:
-            print(f"Successfully scraped {len(app_screenshots)} screenshots from AppAdvice")
-        
-        print("Scraping completed successfully!")
-        
+
+        print("Running scrape stages...")
+        results = build_scheduler(scraper, config, manifest, args.incremental, args.youtube_backfill).run()
+        manifest.save()
+
+        app_screenshots = results['app_screenshots']
+        if app_screenshots.ok:
+            print(f"Successfully scraped {len(app_screenshots.value)} screenshots from AppAdvice")
+
+        print("\nStage summary:")
+        for name, result in results.items():
+            print(f"  {name}: {result.status} ({result.duration:.2f}s)")
+
+        failed = [name for name, result in results.items() if not result.ok]
+        if failed:
+            print(f"Scraping completed with failed stages: {', '.join(failed)}")
+        else:
+            print("Scraping completed successfully!")
+
     except Exception as e:
         print(f"An error occurred: {e}")
     finally:
-        scraper.driver.quit()
+        scraper.close()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
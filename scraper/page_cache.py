@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class CachedPage:
+    """Rendered page source with its lazily parsed soup"""
+
+    def __init__(self, url, title, page_source, fetched_at=None):
+        self.url = url
+        self.title = title
+        self.page_source = page_source
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.soup = None
+
+    @property
+    def size(self):
+        return len(self.page_source)
+
+
+class PageCache:
+    """Per-run cache of rendered pages and parsed DOMs keyed by URL
+
+    Entries expire after `ttl` seconds and the least recently used ones are
+    evicted once `max_entries` or `max_bytes` of page source is exceeded.
+    Concurrent requests for the same URL share a single load. When
+    `persist_dir` is set, page sources are also written to disk and reused
+    by later runs while they are younger than the TTL.
+    """
+
+    def __init__(self, ttl=3600, max_entries=64, max_bytes=64 * 1024 * 1024, persist_dir=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.persist_dir = persist_dir
+
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+        if persist_dir:
+            os.makedirs(persist_dir, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a cache from the 'page_cache' section of the scraper config"""
+        return cls(
+            ttl=config.get('ttl', 3600),
+            max_entries=config.get('max_entries', 64),
+            max_bytes=config.get('max_mb', 64) * 1024 * 1024,
+            persist_dir=config.get('persist_dir')
+        )
+
+    def _expired(self, page):
+        return self.ttl is not None and time.time() - page.fetched_at > self.ttl
+
+    def _disk_path(self, url):
+        return os.path.join(self.persist_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def _read_disk(self, url):
+        if not self.persist_dir:
+            return None
+        path = self._disk_path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            page = CachedPage(record['url'], record['title'], record['page_source'], record['fetched_at'])
+            return None if self._expired(page) else page
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error reading cached page for {url}: {e}")
+            return None
+
+    def _write_disk(self, page):
+        if not self.persist_dir:
+            return
+        path = self._disk_path(page.url)
+        try:
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump({
+                    'url': page.url,
+                    'title': page.title,
+                    'page_source': page.page_source,
+                    'fetched_at': page.fetched_at
+                }, f, ensure_ascii=False)
+            os.replace(path + '.tmp', path)
+        except Exception as e:
+            print(f"Error persisting cached page for {page.url}: {e}")
+
+    def _lookup(self, url):
+        with self._lock:
+            page = self._entries.get(url)
+            if page is None:
+                return None
+            if self._expired(page):
+                self._remove(url)
+                return None
+            self._entries.move_to_end(url)
+            return page
+
+    def _remove(self, url):
+        page = self._entries.pop(url)
+        self._total_bytes -= page.size
+
+    def _store(self, page):
+        with self._lock:
+            if page.url in self._entries:
+                self._remove(page.url)
+            self._entries[page.url] = page
+            self._total_bytes += page.size
+            while self._entries and (len(self._entries) > self.max_entries or
+                                     self._total_bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                if oldest == page.url and len(self._entries) == 1:
+                    break
+                self._remove(oldest)
+
+    def get_page(self, url, loader):
+        """Return the cached page for url, calling loader() on a miss
+
+        loader returns (title, page_source) or (title, page_source, soup) when
+        it already parsed the page.
+        """
+        page = self._lookup(url)
+        if page is not None:
+            return page
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(url, threading.Lock())
+
+        with key_lock:
+            # Another thread may have loaded it while we waited
+            page = self._lookup(url)
+            if page is not None:
+                return page
+
+            page = self._read_disk(url)
+            if page is None:
+                loaded = loader()
+                page = CachedPage(url, loaded[0], loaded[1])
+                if len(loaded) > 2:
+                    page.soup = loaded[2]
+                self._write_disk(page)
+            self._store(page)
+            return page
+
+    def get_soup(self, url, loader, parse):
+        """Return the parsed soup for url, parsing the page source at most once"""
+        page = self.get_page(url, loader)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(url, threading.Lock())
+        with key_lock:
+            if page.soup is None:
+                page.soup = parse(page.page_source)
+        return page.soup
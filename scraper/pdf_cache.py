@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class PdfCache:
+    """On-disk cache of PDF extraction results keyed by content hash
+
+    The key combines the SHA-256 of the PDF bytes with the extraction
+    settings, so changing DPI, image mode or output folder never serves a
+    stale result. Entries hold the per-page text records and the paths of
+    the saved images; an entry whose images were deleted is treated as a
+    miss. Once the cache directory grows past `max_bytes` the least recently
+    used entries are removed (the images themselves are outputs and are
+    left alone).
+    """
+
+    def __init__(self, root='scraped_data/.cache/pdf', max_bytes=256 * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a cache from the 'pdf_cache' section of the scraper config"""
+        if not config.get('enabled', True):
+            return None
+        return cls(
+            root=config.get('root', 'scraped_data/.cache/pdf'),
+            max_bytes=config.get('max_mb', 256) * 1024 * 1024
+        )
+
+    @staticmethod
+    def make_key(content_hash, settings):
+        payload = json.dumps({'content': content_hash, 'settings': settings}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.root, f"{key}.json")
+
+    def get(self, key):
+        """Return the cached {'pages', 'saved_images'} record, or None"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error reading PDF cache entry {key[:12]}: {e}")
+            return None
+
+        if any(not os.path.exists(image) for image in record.get('saved_images') or []):
+            return None
+
+        # Refresh the access time used for LRU eviction
+        now = time.time()
+        os.utime(path, (now, now))
+        return record
+
+    def put(self, key, pages, saved_images):
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'pages': pages, 'saved_images': saved_images}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Error writing PDF cache entry {key[:12]}: {e}")
+            return
+        self._evict()
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.root):
+                if not name.endswith('.json'):
+                    continue
+                stat = os.stat(os.path.join(self.root, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, name in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                os.remove(os.path.join(self.root, name))
+                total -= size
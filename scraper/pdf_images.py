@@ -0,0 +1,131 @@
+import hashlib
+import os
+from pdf_render import iter_rendered_pages
+
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf
+    except ImportError:
+        pymupdf = None
+
+# Formats the site build copies; other embedded formats (jpx, jb2, ...) are converted to PNG
+WEB_IMAGE_EXTS = ('jpg', 'jpeg', 'png', 'gif')
+# Prefixes of the files this module writes into an output folder
+OUTPUT_PREFIXES = ('image_', 'page_')
+
+
+def embedded_images_supported():
+    return pymupdf is not None
+
+
+def page_ranges(pages):
+    """Group sorted page numbers into (first, last) runs"""
+    ranges = []
+    for page in sorted(pages):
+        if ranges and page == ranges[-1][1] + 1:
+            ranges[-1][1] = page
+        else:
+            ranges.append([page, page])
+    return [tuple(r) for r in ranges]
+
+
+def clear_outputs(output_folder):
+    """Remove images left in the folder by an earlier extraction of the same PDF"""
+    if not os.path.isdir(output_folder):
+        return
+    for name in os.listdir(output_folder):
+        path = os.path.join(output_folder, name)
+        if name.startswith(OUTPUT_PREFIXES) and os.path.isfile(path):
+            os.remove(path)
+
+
+def web_image(doc, xref, extracted):
+    """Return (bytes, extension) of an extracted image in a format browsers display"""
+    if extracted['ext'].lower() in WEB_IMAGE_EXTS:
+        return extracted['image'], extracted['ext']
+    pixmap = pymupdf.Pixmap(doc, xref)
+    if pixmap.n - pixmap.alpha > 3:
+        pixmap = pymupdf.Pixmap(pymupdf.csRGB, pixmap)
+    return pixmap.tobytes('png'), 'png'
+
+
+def extract_embedded_images(pdf_path, output_folder, min_width=100, min_height=100, seen_hashes=None):
+    """Save the image XObjects embedded in a PDF without rendering any page
+
+    Images smaller than min_width x min_height (icons, bullets, rules) are
+    ignored and identical images are written once, named by content hash.
+    seen_hashes may be shared between calls to deduplicate across files.
+    Formats browsers cannot show are converted to PNG.
+
+    Returns (saved image paths, page numbers that have no usable embedded
+    image and therefore need to be rasterized).
+    """
+    if pymupdf is None:
+        raise RuntimeError("PyMuPDF is required to extract embedded PDF images")
+
+    os.makedirs(output_folder, exist_ok=True)
+    seen_hashes = seen_hashes if seen_hashes is not None else set()
+    saved_images = []
+    pages_without_images = []
+    usable_xrefs = {}
+
+    with pymupdf.open(pdf_path) as doc:
+        for page_index in range(doc.page_count):
+            page_has_image = False
+            for image in doc.get_page_images(page_index, full=True):
+                xref, width, height = image[0], image[2], image[3]
+                if width < min_width or height < min_height:
+                    continue
+
+                # The same XObject is often placed on several pages
+                if xref not in usable_xrefs:
+                    extracted = doc.extract_image(xref)
+                    if not extracted or not extracted.get('image'):
+                        usable_xrefs[xref] = False
+                        continue
+                    digest = hashlib.sha256(extracted['image']).hexdigest()
+                    if digest not in seen_hashes:
+                        seen_hashes.add(digest)
+                        data, ext = web_image(doc, xref, extracted)
+                        image_path = os.path.join(output_folder, f"image_{digest[:16]}.{ext}")
+                        with open(image_path, 'wb') as f:
+                            f.write(data)
+                        saved_images.append(image_path)
+                    usable_xrefs[xref] = True
+
+                page_has_image = page_has_image or usable_xrefs[xref]
+
+            if not page_has_image:
+                pages_without_images.append(page_index + 1)
+
+    return saved_images, pages_without_images
+
+
+def save_pdf_images(pdf_path, output_folder, render_settings, mode='render', min_size=(100, 100)):
+    """Save the images of a PDF according to the configured image mode
+
+    In 'embedded' mode the original images stored in the PDF are saved and
+    only pages without any usable embedded image are rendered; in 'render'
+    mode every page is rasterized. Images of a previous extraction into the
+    same folder are removed first, so a mode change leaves no stale files.
+    """
+    clear_outputs(output_folder)
+    if mode == 'embedded':
+        if embedded_images_supported():
+            saved_images, pages_to_render = extract_embedded_images(pdf_path, output_folder, *min_size)
+            for first_page, last_page in page_ranges(pages_to_render):
+                saved_images.extend(
+                    image_path for _, image_path in iter_rendered_pages(
+                        pdf_path, output_folder, render_settings, first_page, last_page
+                    )
+                )
+            return saved_images
+        print("PyMuPDF is not installed, rendering PDF pages instead")
+
+    # Pages are rendered and written a window at a time to bound memory
+    return [
+        image_path for _, image_path
+        in iter_rendered_pages(pdf_path, output_folder, render_settings)
+    ]
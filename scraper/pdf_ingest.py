@@ -0,0 +1,221 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+import PyPDF2
+from pdf_images import save_pdf_images
+from pdf_text import extract_page_texts, text_extractor_key
+from run_manifest import file_sha256
+
+
+def count_pages(pdf_path):
+    with open(pdf_path, 'rb') as f:
+        return len(PyPDF2.PdfReader(f).pages)
+
+
+class PdfJob:
+    """A PDF to ingest and the folder its images go to"""
+
+    def __init__(self, pdf_path, images_folder=None):
+        self.pdf_path = str(pdf_path)
+        self.images_folder = images_folder
+
+
+class PdfResult:
+    """Per-page text records and saved images of one PDF"""
+
+    def __init__(self, job, pages=None, saved_images=None, error=None, cached=False):
+        self.job = job
+        self.pages = pages or []
+        self.saved_images = saved_images
+        self.error = error
+        self.cached = cached
+
+    @property
+    def text(self):
+        return ''.join(page['text'] for page in self.pages)
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs tasks immediately in the calling process"""
+
+    def submit(self, func, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait=True):
+        pass
+
+
+class PdfIngestEngine:
+    """Fan PDF text and image extraction out over a process pool
+
+    Every file is split into page ranges of `pages_per_task` pages for text
+    extraction, and its image extraction runs as a separate task, so a single
+    large PDF and many small ones both spread across cores. Results are
+    yielded per file in job order. workers=1 runs everything in-process;
+    workers=0 uses one process per CPU. With a PdfCache, files whose content
+    and settings were seen before are served from it without any work.
+
+    The pool is created on first use and shared by every caller of the
+    engine until close(). Its workers are spawned rather than forked, since
+    the engine is driven from scheduler threads and forking a threaded
+    process can deadlock the child. A worker that dies (a crash or OOM on a
+    bad PDF) breaks the pool: the jobs it held fail and the next call
+    starts a fresh pool.
+    """
+
+    def __init__(self, render_settings, image_mode='render', min_image_size=(100, 100),
+                 workers=0, pages_per_task=16, cache=None, text_mode='raw'):
+        self.render_settings = render_settings
+        self.image_mode = image_mode
+        self.min_image_size = tuple(min_image_size)
+        self.workers = workers
+        self.pages_per_task = max(1, pages_per_task)
+        self.cache = cache
+        self.text_mode = text_mode
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, render_settings, config, cache=None):
+        """Build an engine from the 'pdf' section of the scraper config"""
+        return cls(
+            render_settings,
+            image_mode=config.get('image_mode', 'render'),
+            min_image_size=(config.get('min_image_width', 100), config.get('min_image_height', 100)),
+            workers=config.get('workers', 0),
+            pages_per_task=config.get('pages_per_task', 16),
+            cache=cache,
+            text_mode=config.get('text_mode', 'raw')
+        )
+
+    def settings_key(self, job):
+        """Everything besides the PDF bytes that affects a job's result"""
+        return {
+            'text_extractor': text_extractor_key(self.text_mode),
+            'images_folder': job.images_folder,
+            'image_mode': self.image_mode,
+            'min_image_size': list(self.min_image_size),
+            'render': self.render_settings.key()
+        }
+
+    def _cached(self, job):
+        """Return (cache key, cached PdfResult or None)"""
+        if self.cache is None:
+            return None, None
+        try:
+            key = self.cache.make_key(file_sha256(job.pdf_path), self.settings_key(job))
+        except Exception as e:
+            print(f"Error hashing {job.pdf_path}: {e}")
+            return None, None
+        record = self.cache.get(key)
+        if record is None:
+            return key, None
+        return key, PdfResult(job, record['pages'], record['saved_images'], cached=True)
+
+    def _executor(self):
+        with self._pool_lock:
+            if self._pool is None:
+                if self.workers == 1:
+                    self._pool = _InlineExecutor()
+                else:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers or None, mp_context=multiprocessing.get_context('spawn')
+                    )
+            return self._pool
+
+    def _discard(self, pool):
+        """Drop a broken pool so the next call creates a new one"""
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False)
+
+    def close(self):
+        """Shut the worker pool down"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def _submit(self, executor, job):
+        """Queue all tasks for one job; returns (text futures, image future) or an exception"""
+        try:
+            page_count = count_pages(job.pdf_path)
+            text_futures = [
+                executor.submit(extract_page_texts, job.pdf_path, first,
+                                min(first + self.pages_per_task - 1, page_count), self.text_mode)
+                for first in range(1, page_count + 1, self.pages_per_task)
+            ]
+            image_future = None
+            if job.images_folder:
+                image_future = executor.submit(
+                    save_pdf_images, job.pdf_path, job.images_folder,
+                    self.render_settings, self.image_mode, self.min_image_size
+                )
+        except BrokenProcessPool as e:
+            self._discard(executor)
+            return e
+        except Exception as e:
+            return e
+        return text_futures, image_future
+
+    def iter_ingest(self, jobs):
+        """Yield a PdfResult per job, in job order, as soon as each one is complete"""
+        jobs = list(jobs)
+        if not jobs:
+            return
+        lookups = [self._cached(job) for job in jobs]
+        pending = [job for job, (_, hit) in zip(jobs, lookups) if hit is None]
+        if not pending:
+            for _, hit in lookups:
+                yield hit
+            return
+
+        executor = self._executor()
+        submitted = {id(job): self._submit(executor, job) for job in pending}
+        for job, (key, hit) in zip(jobs, lookups):
+            if hit is not None:
+                yield hit
+                continue
+
+            tasks = submitted[id(job)]
+            if isinstance(tasks, Exception):
+                yield PdfResult(job, error=tasks)
+                continue
+            text_futures, image_future = tasks
+            try:
+                pages = []
+                for future in text_futures:
+                    pages.extend(future.result())
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    self._discard(executor)
+                yield PdfResult(job, error=e)
+                continue
+
+            saved_images = None
+            images_ok = True
+            if image_future is not None:
+                try:
+                    saved_images = image_future.result()
+                except Exception as e:
+                    # Text is still useful without images
+                    if isinstance(e, BrokenProcessPool):
+                        self._discard(executor)
+                    images_ok = False
+                    print(f"Error extracting images from {os.path.basename(job.pdf_path)}: {e}")
+
+            # Partial results are not cached so the next run retries them
+            if key is not None and images_ok:
+                self.cache.put(key, pages, saved_images)
+            yield PdfResult(job, pages, saved_images)
+
+    def ingest(self, jobs):
+        return list(self.iter_ingest(jobs))
@@ -0,0 +1,100 @@
+import os
+import re
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+# Extension and PIL save options per output format
+OUTPUT_FORMATS = {
+    'jpeg': ('jpg', 'JPEG'),
+    'png': ('png', 'PNG'),
+    'webp': ('webp', 'WEBP')
+}
+
+# US Letter in points, used when pdfinfo does not report a page size
+DEFAULT_PAGE_SIZE = (612.0, 792.0)
+
+
+class RenderSettings:
+    """Rasterization options shared by every PDF stage"""
+
+    def __init__(self, dpi=200, fmt='jpeg', quality=85, thread_count=1, max_megapixels=64):
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported image format {fmt!r}, expected one of {list(OUTPUT_FORMATS)}")
+        self.dpi = dpi
+        self.fmt = fmt
+        self.quality = quality
+        self.thread_count = max(1, thread_count)
+        self.max_megapixels = max_megapixels
+
+    @classmethod
+    def from_config(cls, config):
+        """Build settings from the 'pdf' section of the scraper config"""
+        return cls(
+            dpi=config.get('dpi', 200),
+            fmt=config.get('format', 'jpeg'),
+            quality=config.get('quality', 85),
+            thread_count=config.get('thread_count', 1),
+            max_megapixels=config.get('max_megapixels', 64)
+        )
+
+    def key(self):
+        """Values that change the rendered output"""
+        return {'dpi': self.dpi, 'format': self.fmt, 'quality': self.quality}
+
+
+def page_count_and_size(pdf_path):
+    """Return (page count, (width, height) in points of the first page)"""
+    info = pdfinfo_from_path(pdf_path)
+    size = DEFAULT_PAGE_SIZE
+    match = re.match(r'\s*([\d.]+)\s*x\s*([\d.]+)', info.get('Page size', ''))
+    if match:
+        size = (float(match.group(1)), float(match.group(2)))
+    return int(info['Pages']), size
+
+
+def pages_per_window(page_size, settings):
+    """How many pages fit in the pixel budget at the configured DPI"""
+    width = page_size[0] / 72 * settings.dpi
+    height = page_size[1] / 72 * settings.dpi
+    page_pixels = max(1.0, width * height)
+    return max(1, int(settings.max_megapixels * 1_000_000 // page_pixels))
+
+
+def iter_rendered_pages(pdf_path, output_folder, settings, first_page=1, last_page=None,
+                        name_template='page_{page}'):
+    """Render pages to output_folder in windows, yielding (page number, path) as they are saved
+
+    Only one window of decoded pages is held in memory at a time; its size
+    is chosen so that the estimated pixel count stays within
+    settings.max_megapixels.
+    """
+    os.makedirs(output_folder, exist_ok=True)
+    page_count, page_size = page_count_and_size(pdf_path)
+    last_page = min(last_page or page_count, page_count)
+    window = pages_per_window(page_size, settings)
+    ext, pil_format = OUTPUT_FORMATS[settings.fmt]
+
+    save_options = {}
+    if settings.fmt in ('jpeg', 'webp'):
+        save_options['quality'] = settings.quality
+
+    start = first_page
+    while start <= last_page:
+        end = min(start + window - 1, last_page)
+        images = convert_from_path(
+            pdf_path,
+            dpi=settings.dpi,
+            first_page=start,
+            last_page=end,
+            thread_count=min(settings.thread_count, end - start + 1)
+        )
+        try:
+            for offset, image in enumerate(images):
+                page = start + offset
+                image_path = os.path.join(output_folder, f"{name_template.format(page=page)}.{ext}")
+                image.save(image_path, pil_format, **save_options)
+                yield page, image_path
+        finally:
+            for image in images:
+                image.close()
+            del images
+        start = end + 1
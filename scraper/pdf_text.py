@@ -0,0 +1,131 @@
+import re
+import PyPDF2
+
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf
+    except ImportError:
+        pymupdf = None
+
+TEXT_MODES = ('raw', 'layout')
+
+# Zero-width characters some generators emit as padding between words
+INVISIBLE = re.compile('[\u200b\u200c\u200d\u2060\ufeff]')
+WHITESPACE = re.compile(r'\s+')
+
+# A horizontal gap wider than this many line heights separates table cells
+CELL_GAP = 1.5
+# A vertical gap wider than this many line heights starts a new paragraph
+PARAGRAPH_GAP = 0.5
+
+
+def text_extractor_key(mode):
+    """Identifies the text extraction used, for cache keys"""
+    if mode == 'layout' and pymupdf is not None:
+        return f"layout PyMuPDF {pymupdf.VersionBind}"
+    if mode == 'layout':
+        return f"collapsed PyPDF2 {PyPDF2.__version__}"
+    return f"PyPDF2 {PyPDF2.__version__}"
+
+
+def collapse_whitespace(text):
+    """Fallback normalization: drop padding and join everything with single spaces"""
+    return WHITESPACE.sub(' ', INVISIBLE.sub('', text)).strip()
+
+
+def group_lines(words):
+    """Group (x0, y0, x1, y1, text) word boxes into lines in reading order
+
+    Words belong to the same line when their vertical centre falls inside
+    the line's extent. Each line is (y0, y1, cells), where cells are runs of
+    words separated by a gap wide enough to be a table column.
+    """
+    lines = []
+    for x0, y0, x1, y1, text in sorted(words, key=lambda w: ((w[1] + w[3]) / 2, w[0])):
+        centre = (y0 + y1) / 2
+        if lines and lines[-1]['y0'] <= centre <= lines[-1]['y1']:
+            line = lines[-1]
+            line['y0'], line['y1'] = min(line['y0'], y0), max(line['y1'], y1)
+            line['words'].append((x0, x1, text))
+        else:
+            lines.append({'y0': y0, 'y1': y1, 'words': [(x0, x1, text)]})
+
+    grouped = []
+    for line in lines:
+        height = line['y1'] - line['y0']
+        cells = []
+        last_x1 = None
+        for x0, x1, text in sorted(line['words']):
+            if last_x1 is None or x0 - last_x1 > CELL_GAP * height:
+                cells.append([])
+            cells[-1].append(text)
+            last_x1 = x1
+        grouped.append((line['y0'], line['y1'], [' '.join(cell) for cell in cells]))
+    return grouped
+
+
+def join_lines(lines):
+    """Rebuild paragraphs from grouped lines
+
+    Consecutive single-cell lines are wrapped prose and are joined with a
+    space (undoing end-of-line hyphenation); table rows keep their own line
+    with cells separated by ' | '. A larger vertical gap ends the paragraph.
+    """
+    paragraphs = []
+    previous = None
+    for y0, y1, cells in lines:
+        text = ' | '.join(cells)
+        if previous is None or y0 - previous[1] > PARAGRAPH_GAP * (previous[1] - previous[0]):
+            paragraphs.append(text)
+        elif len(cells) == 1 and len(previous[2]) == 1:
+            current = paragraphs[-1]
+            if current.endswith('-') and text[:1].islower():
+                paragraphs[-1] = current[:-1] + text
+            else:
+                paragraphs[-1] = f"{current} {text}"
+        else:
+            paragraphs[-1] = f"{paragraphs[-1]}\n{text}"
+        previous = (y0, y1, cells)
+    return paragraphs
+
+
+def layout_page_text(page):
+    """Compact paragraph-structured text of a PyMuPDF page"""
+    words = []
+    for x0, y0, x1, y1, text, *_ in page.get_text('words'):
+        text = INVISIBLE.sub('', text).strip()
+        if text:
+            words.append((x0, y0, x1, y1, text))
+    paragraphs = join_lines(group_lines(words))
+    return '\n\n'.join(paragraphs) + '\n\n' if paragraphs else ''
+
+
+def extract_page_texts(pdf_path, first_page, last_page, mode='raw'):
+    """Extract text from a page range (1-based, inclusive) as per-page records
+
+    'raw' keeps PyPDF2's output verbatim; 'layout' rebuilds lines and
+    paragraphs from word positions, or only collapses whitespace when
+    PyMuPDF is not installed.
+    """
+    if mode not in TEXT_MODES:
+        raise ValueError(f"Unsupported text mode {mode!r}, expected one of {list(TEXT_MODES)}")
+
+    if mode == 'layout' and pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            return [
+                {'page': page, 'text': layout_page_text(doc[page - 1])}
+                for page in range(first_page, last_page + 1)
+            ]
+
+    with open(pdf_path, 'rb') as f:
+        reader = PyPDF2.PdfReader(f)
+        pages = []
+        for page in range(first_page, last_page + 1):
+            text = reader.pages[page - 1].extract_text()
+            if mode == 'layout':
+                text = collapse_whitespace(text)
+                text = f"{text}\n\n" if text else ''
+            pages.append({'page': page, 'text': text})
+        return pages
@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class RunManifest:
+    """Per-source fingerprints recorded by the last successful run
+
+    A fingerprint is any JSON-serializable value that changes whenever the
+    upstream source changes (HTTP validators, latest video id, file hashes).
+    In incremental mode a stage whose fingerprint matches the recorded one
+    is skipped and its previous output reused.
+    """
+
+    def __init__(self, path='scraped_data/run_manifest.json'):
+        self.path = path
+        self._lock = threading.Lock()
+        self.skipped = set()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.sources = json.load(f).get('sources', {})
+        except FileNotFoundError:
+            self.sources = {}
+        except Exception as e:
+            print(f"Error loading run manifest, starting fresh: {e}")
+            self.sources = {}
+
+    def fingerprint(self, name):
+        with self._lock:
+            return self.sources.get(name, {}).get('fingerprint')
+
+    def unchanged(self, name, fingerprint):
+        """True when fingerprint is known and equal to the recorded one"""
+        return fingerprint is not None and self.fingerprint(name) == fingerprint
+
+    def record(self, name, fingerprint):
+        with self._lock:
+            self.sources[name] = {
+                'fingerprint': fingerprint,
+                'updated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+
+    def mark_skipped(self, name):
+        with self._lock:
+            self.skipped.add(name)
+
+    def save(self):
+        """Atomically write the manifest to disk"""
+        with self._lock:
+            snapshot = json.dumps({'sources': self.sources}, indent=2, ensure_ascii=False, sort_keys=True)
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(snapshot)
+        os.replace(tmp_path, self.path)
+
+
+def http_fingerprint(session, url, timeout=10):
+    """Fingerprint a URL from its HTTP validators, or None if it has none"""
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+        if response.status_code >= 400:
+            return None
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+        if not any(validators.values()):
+            return None
+        return validators
+    except Exception as e:
+        print(f"Error fingerprinting {url}: {e}")
+        return None
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_fingerprints(paths, previous=None):
+    """Return {path: {size, mtime, sha256}}, rehashing only files whose size/mtime changed"""
+    previous = previous or {}
+    fingerprints = {}
+    for path in paths:
+        path = str(path)
+        stat = os.stat(path)
+        known = previous.get(path)
+        if known and known.get('size') == stat.st_size and known.get('mtime') == stat.st_mtime:
+            fingerprints[path] = known
+        else:
+            fingerprints[path] = {
+                'size': stat.st_size,
+                'mtime': stat.st_mtime,
+                'sha256': file_sha256(path)
+            }
+    return fingerprints
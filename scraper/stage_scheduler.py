@@ -0,0 +1,209 @@
+import threading
+import time
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+
+
+class Stage:
+    """A unit of scraping work with its dependencies"""
+
+    def __init__(self, name, func, depends_on=(), timeout=None):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.timeout = timeout
+
+
+class StageResult:
+    """Outcome of a single stage run"""
+
+    def __init__(self, name, status, value=None, error=None, duration=0.0):
+        self.name = name
+        self.status = status
+        self.value = value
+        self.error = error
+        self.duration = duration
+
+    @property
+    def ok(self):
+        return self.status == 'success'
+
+    def __repr__(self):
+        return f"StageResult({self.name!r}, {self.status!r}, {self.duration:.2f}s)"
+
+
+class StageScheduler:
+    """Run up to max_workers stages at once, respecting dependencies
+
+    Each stage starts as soon as all of its dependencies have succeeded.
+    The return values of the dependencies are passed to the stage function
+    as positional arguments, in the order they were declared. A stage that
+    raises, returns None or exceeds its timeout is recorded as failed and
+    its dependents are skipped; independent stages keep running. The
+    timeout counts from when the stage begins, and a timed-out stage no
+    longer takes up one of the max_workers slots.
+    """
+
+    def __init__(self, max_workers=4, default_timeout=None):
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self.stages = {}
+
+    def add_stage(self, name, func, depends_on=(), timeout=None):
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        self.stages[name] = Stage(name, func, depends_on, timeout)
+        return self.stages[name]
+
+    def _validate(self):
+        for stage in self.stages.values():
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage {stage.name} depends on unknown stage {dep}")
+
+        # Detect cycles with a depth-first walk
+        visiting, visited = set(), set()
+
+        def visit(name):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle detected at stage {name}")
+            visiting.add(name)
+            for dep in self.stages[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def _run_stage(self, stage, args):
+        start = time.perf_counter()
+        value = stage.func(*args)
+        if value is None:
+            raise RuntimeError(f"Stage {stage.name} returned no data")
+        return value, time.perf_counter() - start
+
+    def _start_stage(self, stage, args):
+        """Run a stage on its own daemon thread
+
+        Returns (future, started), where started['at'] is set once the stage
+        function actually begins. A future cancelled before that never runs.
+        Daemon threads keep an abandoned stage from holding up the process
+        at exit.
+        """
+        future = Future()
+        started = {}
+
+        def work():
+            if not future.set_running_or_notify_cancel():
+                return
+            started['at'] = time.perf_counter()
+            try:
+                future.set_result(self._run_stage(stage, args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=work, name=f"stage-{stage.name}", daemon=True).start()
+        return future, started
+
+    def run(self):
+        """Run all stages and return a dict of stage name -> StageResult"""
+        self._validate()
+
+        results = {}
+        pending = list(self.stages)
+        running = {}  # future -> (stage, submit time, started, timeout)
+
+        try:
+            while len(results) < len(self.stages):
+                # Skip stages whose dependencies did not succeed
+                for name in list(pending):
+                    stage = self.stages[name]
+                    failed = [d for d in stage.depends_on if d in results and not results[d].ok]
+                    if failed:
+                        pending.remove(name)
+                        results[name] = StageResult(
+                            name, 'skipped', error=f"Dependency failed: {', '.join(failed)}"
+                        )
+                        print(f"Skipping stage {name}: dependency failed ({', '.join(failed)})")
+
+                # Start every stage that is ready to run
+                for name in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    stage = self.stages[name]
+                    if not all(d in results for d in stage.depends_on):
+                        continue
+
+                    pending.remove(name)
+                    args = [results[d].value for d in stage.depends_on]
+                    timeout = stage.timeout if stage.timeout is not None else self.default_timeout
+                    future, started = self._start_stage(stage, args)
+                    running[future] = (stage, time.perf_counter(), started, timeout)
+                    print(f"Started stage {name}")
+
+                if not running:
+                    if pending:
+                        # Nothing can make progress; should not happen after validation
+                        for name in pending:
+                            results[name] = StageResult(name, 'skipped', error='Unschedulable')
+                        pending.clear()
+                    break
+
+                # Wait for the next completion or the nearest deadline; a stage
+                # whose thread has not begun yet is polled until it has
+                deadlines = []
+                for stage, submitted, started, timeout in running.values():
+                    if timeout:
+                        deadlines.append(started['at'] + timeout if 'at' in started
+                                         else min(submitted + timeout, time.perf_counter() + 0.05))
+                wait_for = None
+                if deadlines:
+                    wait_for = max(0.0, min(deadlines) - time.perf_counter())
+                done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    stage, _, started, _ = running.pop(future)
+                    try:
+                        value, duration = future.result()
+                        results[stage.name] = StageResult(stage.name, 'success', value, duration=duration)
+                        print(f"Finished stage {stage.name} in {duration:.2f}s")
+                    except Exception as e:
+                        duration = time.perf_counter() - started.get('at', time.perf_counter())
+                        results[stage.name] = StageResult(stage.name, 'failed', error=e, duration=duration)
+                        print(f"Stage {stage.name} failed after {duration:.2f}s: {e}")
+
+                # Give up on stages that ran past their deadline. Threads cannot be
+                # killed, so the stage is abandoned: it stops counting as running
+                # and its late result is discarded when the thread returns.
+                now = time.perf_counter()
+                for future, (stage, submitted, started, timeout) in list(running.items()):
+                    if not timeout:
+                        continue
+                    if 'at' not in started:
+                        # Never began within its timeout: cancel it so it cannot run later
+                        if now >= submitted + timeout and future.cancel():
+                            del running[future]
+                            results[stage.name] = StageResult(stage.name, 'timeout', error='Did not start in time')
+                            print(f"Stage {stage.name} did not start within {timeout}s")
+                        continue
+                    if now >= started['at'] + timeout:
+                        del running[future]
+                        start = started['at']
+                        results[stage.name] = StageResult(
+                            stage.name, 'timeout', error=f"Timed out after {now - start:.2f}s",
+                            duration=now - start
+                        )
+                        print(f"Stage {stage.name} timed out after {now - start:.2f}s")
+                        future.add_done_callback(
+                            lambda _, name=stage.name, start=start: print(
+                                f"Timed-out stage {name} finished after {time.perf_counter() - start:.2f}s"
+                            )
+                        )
+        finally:
+            # Stages that never began must not run after the caller moved on
+            for future in running:
+                future.cancel()
+
+        return results
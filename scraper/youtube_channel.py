@@ -0,0 +1,152 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import yt_dlp
+
+# Seconds before a stalled YouTube request is abandoned
+SOCKET_TIMEOUT = 20
+
+
+def uploads_url(channel_url):
+    return f"{channel_url.rstrip('/')}/videos"
+
+
+def list_uploads(channel_url, limit=None, known_ids=None):
+    """List a channel's uploads (newest first) in a single flat extraction
+
+    Returns (channel info, flat video entries). With process=False the
+    entries are a generator that fetches listing pages lazily, so only the
+    pages needed are requested: listing stops after `limit` entries, or at
+    the first entry whose id is in known_ids (everything older is known).
+    """
+    known_ids = known_ids or set()
+    entries = []
+    with yt_dlp.YoutubeDL({'extract_flat': 'in_playlist', 'quiet': True, 'socket_timeout': SOCKET_TIMEOUT}) as ydl:
+        listing = ydl.extract_info(uploads_url(channel_url), download=False, process=False)
+        for entry in listing.get('entries') or []:
+            if not entry:
+                continue
+            if (entry.get('id') or entry.get('url')) in known_ids:
+                break
+            entries.append(entry)
+            if limit is not None and len(entries) >= limit:
+                break
+    channel = {
+        'id': listing.get('id'),
+        'name': listing.get('uploader') or '',
+        'description': listing.get('description') or '',
+        'subscriber_count': listing.get('channel_follower_count')
+    }
+    return channel, entries
+
+
+def video_record(entry, info=None):
+    """A youtube.json video record from a flat entry, completed by the full video info"""
+    info = info or {}
+    view_count = info.get('view_count')
+    return {
+        'title': info.get('title') or entry.get('title', ''),
+        'url': entry.get('id') or entry.get('url', ''),
+        'thumbnail': info.get('thumbnail') or entry.get('thumbnail', ''),
+        'description': info.get('description') or entry.get('description', ''),
+        'view_count': view_count if view_count is not None else entry.get('view_count', 0),
+        'upload_date': info.get('upload_date') or entry.get('upload_date', '')
+    }
+
+
+class VideoCache:
+    """Persistent per-video metadata cache
+
+    Full video extractions are kept for `ttl` seconds (view counts change,
+    the rest rarely does), so a run only queries videos that are new or
+    whose entry went stale.
+    """
+
+    def __init__(self, path='scraped_data/.cache/youtube_videos.json', ttl=7 * 24 * 3600):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            self.entries = {}
+        except Exception as e:
+            print(f"Error loading YouTube cache, starting fresh: {e}")
+            self.entries = {}
+
+    def get(self, video_id):
+        with self._lock:
+            entry = self.entries.get(video_id)
+        if entry is None or time.time() - entry['fetched_at'] > self.ttl:
+            return None
+        return entry['info']
+
+    def put(self, video_id, info):
+        with self._lock:
+            self.entries[video_id] = {'fetched_at': time.time(), 'info': info}
+
+    def save(self):
+        """Atomically write the cache to disk"""
+        with self._lock:
+            snapshot = json.dumps(self.entries, ensure_ascii=False)
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(snapshot)
+        os.replace(tmp_path, self.path)
+
+
+class VideoEnricher:
+    """Complete flat listing entries with full per-video metadata
+
+    Videos missing from the cache are extracted on up to `max_workers`
+    threads, each with its own YoutubeDL instance. A video whose extraction
+    fails keeps the fields of its listing entry.
+    """
+
+    # Fields of the full extraction worth keeping
+    FIELDS = ('title', 'thumbnail', 'description', 'view_count', 'upload_date', 'channel_follower_count')
+
+    def __init__(self, cache=None, max_workers=4):
+        self.cache = cache
+        self.max_workers = max(1, max_workers)
+        self._local = threading.local()
+
+    @classmethod
+    def from_config(cls, config):
+        """Build an enricher from the 'youtube' section of the scraper config"""
+        cache_path = config.get('cache_path', 'scraped_data/.cache/youtube_videos.json')
+        cache = VideoCache(cache_path, config.get('cache_ttl', 7 * 24 * 3600)) if cache_path else None
+        return cls(cache, config.get('max_workers', 4))
+
+    def _ydl(self):
+        if not hasattr(self._local, 'ydl'):
+            self._local.ydl = yt_dlp.YoutubeDL({'quiet': True, 'skip_download': True, 'socket_timeout': SOCKET_TIMEOUT})
+        return self._local.ydl
+
+    def video_info(self, video_id):
+        info = self.cache.get(video_id) if self.cache else None
+        if info is not None:
+            return info
+        try:
+            full = self._ydl().extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+        except Exception as e:
+            print(f"Error extracting YouTube video {video_id}: {e}")
+            return None
+        info = {field: full.get(field) for field in self.FIELDS}
+        if self.cache is not None:
+            self.cache.put(video_id, info)
+        return info
+
+    def enrich(self, entries):
+        """Return (video records in entry order, full info of the newest video or None)"""
+        if not entries:
+            return [], None
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(entries))) as executor:
+            infos = list(executor.map(lambda entry: self.video_info(entry.get('id') or entry.get('url')), entries))
+        if self.cache is not None:
+            self.cache.save()
+        return [video_record(entry, info) for entry, info in zip(entries, infos)], infos[0]